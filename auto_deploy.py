@@ -8,26 +8,73 @@
 import os
 import sys
 import json
+import shutil
 import subprocess
-import getpass
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
-def run_command(cmd, cwd=None):
-    """运行命令并返回结果"""
+# 仓库名称
+REPO_NAME = "wechat-job-monitor"
+
+# 缓存的GitHub状态，登录后只查询一次
+_USERNAME = None
+_REPO_EXISTS = None
+
+# 一次查询同时获取当前用户名和仓库是否存在
+_GITHUB_STATE_QUERY = "query($name: String!) { viewer { login repository(name: $name) { id } } }"
+
+def run_command(cmd, cwd=None, input=None):
+    """运行命令并返回结果，cmd为参数列表，不经过shell，input为写入标准输入的内容"""
     try:
-        result = subprocess.run(cmd, shell=True, capture_output=True, text=True, cwd=cwd)
+        result = subprocess.run(cmd, capture_output=True, text=True, cwd=cwd, input=input)
         return result.returncode == 0, result.stdout, result.stderr
     except Exception as e:
         return False, "", str(e)
 
+def run_commands(commands, cwd=None, ignore_error=None):
+    """依次运行一组命令，遇到失败立即停止，返回(是否成功, 失败的命令, 错误输出)"""
+    for cmd in commands:
+        success, _, stderr = run_command(cmd, cwd=cwd)
+        if not success and not (ignore_error and ignore_error in stderr):
+            return False, cmd, stderr
+    return True, None, ""
+
+def prefetch_github_state(repo_name=REPO_NAME):
+    """通过一次GraphQL请求获取登录用户名和仓库是否存在，结果缓存供后续步骤使用"""
+    global _USERNAME, _REPO_EXISTS
+    # 仓库不存在时GraphQL会返回错误并以非零状态退出，但响应中仍包含用户信息
+    _, stdout, _ = run_command([
+        "gh", "api", "graphql",
+        "-f", f"query={_GITHUB_STATE_QUERY}",
+        "-f", f"name={repo_name}"
+    ])
+    try:
+        viewer = json.loads(stdout)["data"]["viewer"]
+    except (ValueError, KeyError, TypeError):
+        return False
+    if not viewer or not viewer.get("login"):
+        return False
+    
+    _USERNAME = viewer["login"]
+    _REPO_EXISTS = viewer.get("repository") is not None
+    return True
+
+def get_username():
+    """获取GitHub用户名，首次调用后缓存结果"""
+    global _USERNAME
+    if _USERNAME is None:
+        success, username, _ = run_command(["gh", "api", "user", "--jq", ".login"])
+        if success:
+            _USERNAME = username.strip()
+    return _USERNAME
+
 def check_git_installed():
     """检查git是否安装"""
-    success, _, _ = run_command("git --version")
+    success, _, _ = run_command(["git", "--version"])
     return success
 
 def check_gh_cli_installed():
     """检查GitHub CLI是否安装"""
-    success, _, _ = run_command("gh --version")
+    success, _, _ = run_command(["gh", "--version"])
     return success
 
 def install_gh_cli():
@@ -40,7 +87,7 @@ def install_gh_cli():
     
     if system == "darwin":  # macOS
         print("检测到macOS，使用Homebrew安装...")
-        success, stdout, stderr = run_command("brew install gh")
+        success, stdout, stderr = run_command(["brew", "install", "gh"])
         if success:
             print("✅ GitHub CLI安装成功")
             return True
@@ -50,14 +97,17 @@ def install_gh_cli():
             return False
     elif system == "linux":
         print("检测到Linux，使用包管理器安装...")
-        # 尝试不同的包管理器
-        managers = [
-            "sudo apt install gh",
-            "sudo yum install gh",
-            "sudo pacman -S github-cli"
-        ]
-        for cmd in managers:
-            success, _, _ = run_command(cmd)
+        # 各包管理器对应的安装命令
+        managers = {
+            "apt": ["sudo", "apt", "install", "gh"],
+            "dnf": ["sudo", "dnf", "install", "gh"],
+            "yum": ["sudo", "yum", "install", "gh"],
+            "pacman": ["sudo", "pacman", "-S", "github-cli"]
+        }
+        # 只调用系统中实际存在的包管理器，避免逐个尝试安装
+        manager = next((name for name in managers if shutil.which(name)), None)
+        if manager:
+            success, _, _ = run_command(managers[manager])
             if success:
                 print("✅ GitHub CLI安装成功")
                 return True
@@ -72,17 +122,17 @@ def login_github():
     """登录GitHub"""
     print("🔑 正在登录GitHub...")
     
-    # 检查是否已登录
-    success, stdout, _ = run_command("gh auth status")
-    if success:
+    # 检查是否已登录，同时预取用户名和仓库状态
+    if prefetch_github_state():
         print("✅ 已登录GitHub")
         return True
     
     # 执行登录
     print("请在浏览器中完成GitHub登录...")
-    success, _, _ = run_command("gh auth login")
+    success, _, _ = run_command(["gh", "auth", "login"])
     if success:
         print("✅ GitHub登录成功")
+        prefetch_github_state()
         return True
     else:
         print("❌ GitHub登录失败")
@@ -90,22 +140,26 @@ def login_github():
 
 def create_github_repo():
     """创建GitHub仓库"""
+    global _REPO_EXISTS
     print("📁 正在创建GitHub仓库...")
     
-    repo_name = "wechat-job-monitor"
+    repo_name = REPO_NAME
     description = "微信公众号招聘信息自动监控系统"
     
-    # 检查仓库是否已存在
-    success, _, _ = run_command(f"gh repo view {repo_name}")
-    if success:
+    # 检查仓库是否已存在，优先使用登录时预取的状态
+    if _REPO_EXISTS is None:
+        success, _, _ = run_command(["gh", "repo", "view", repo_name])
+        _REPO_EXISTS = success
+    if _REPO_EXISTS:
         print(f"✅ 仓库 {repo_name} 已存在")
         return repo_name
     
     # 创建新仓库
-    cmd = f'gh repo create {repo_name} --public --description "{description}"'
+    cmd = ["gh", "repo", "create", repo_name, "--public", "--description", description]
     success, stdout, stderr = run_command(cmd)
     
     if success:
+        _REPO_EXISTS = True
         print(f"✅ 仓库 {repo_name} 创建成功")
         return repo_name
     else:
@@ -122,18 +176,15 @@ def init_git_repo():
         return True
     
     # 初始化Git仓库
-    commands = [
-        "git init",
-        "git add .",
-        'git commit -m "Initial commit - 微信公众号招聘信息监控系统"'
-    ]
-    
-    for cmd in commands:
-        success, _, stderr = run_command(cmd)
-        if not success:
-            print(f"❌ 命令失败: {cmd}")
-            print(f"错误: {stderr}")
-            return False
+    success, failed_cmd, stderr = run_commands([
+        ["git", "init", "-q"],
+        ["git", "add", "-A"],
+        ["git", "commit", "-q", "-m", "Initial commit - 微信公众号招聘信息监控系统"]
+    ])
+    if not success:
+        print(f"❌ 命令失败: {' '.join(failed_cmd)}")
+        print(f"错误: {stderr}")
+        return False
     
     print("✅ Git仓库初始化成功")
     return True
@@ -143,26 +194,22 @@ def push_to_github(repo_name):
     print("📤 正在推送代码到GitHub...")
     
     # 获取GitHub用户名
-    success, username, _ = run_command("gh api user --jq .login")
-    if not success:
+    username = get_username()
+    if not username:
         print("❌ 无法获取GitHub用户名")
         return False
     
-    username = username.strip()
     remote_url = f"https://github.com/{username}/{repo_name}.git"
     
-    commands = [
-        f"git remote add origin {remote_url}",
-        "git branch -M main",
-        "git push -u origin main"
-    ]
-    
-    for cmd in commands:
-        success, _, stderr = run_command(cmd)
-        if not success and "already exists" not in stderr:
-            print(f"❌ 命令失败: {cmd}")
-            print(f"错误: {stderr}")
-            return False
+    success, failed_cmd, stderr = run_commands([
+        ["git", "remote", "add", "origin", remote_url],
+        ["git", "branch", "-M", "main"],
+        ["git", "push", "-u", "origin", "main"]
+    ], ignore_error="already exists")
+    if not success:
+        print(f"❌ 命令失败: {' '.join(failed_cmd)}")
+        print(f"错误: {stderr}")
+        return False
     
     print("✅ 代码推送成功")
     return True, username
@@ -188,15 +235,6 @@ def set_github_secrets(repo_name, username):
         "SERVER_CHAN_KEY": "Server酱密钥"
     }
     
-    # 设置必需的secrets
-    for secret_name, secret_value in secrets.items():
-        cmd = f'gh secret set {secret_name} --body "{secret_value}" --repo {username}/{repo_name}'
-        success, _, stderr = run_command(cmd)
-        if success:
-            print(f"✅ 设置 {secret_name} 成功")
-        else:
-            print(f"❌ 设置 {secret_name} 失败: {stderr}")
-    
     # 询问是否设置可选secrets
     print("\n📧 是否配置邮件通知？(推荐)")
     setup_email = input("输入 y 配置邮件通知，输入 n 跳过: ").lower().strip()
@@ -204,17 +242,23 @@ def set_github_secrets(repo_name, username):
     if setup_email == 'y':
         print("\n请输入邮件配置信息:")
         
-        email_secrets = {}
         for secret_name, description in optional_secrets.items():
             if secret_name.startswith(('SMTP_', 'SENDER_', 'RECEIVER_')):
                 value = input(f"{description}: ").strip()
                 if value:
-                    email_secrets[secret_name] = value
-        
-        # 设置邮件相关secrets
-        for secret_name, secret_value in email_secrets.items():
-            cmd = f'gh secret set {secret_name} --body "{secret_value}" --repo {username}/{repo_name}'
-            success, _, stderr = run_command(cmd)
+                    secrets[secret_name] = value
+    
+    def _set_one(secret_name, secret_value):
+        # 密钥值通过标准输入传给gh，不出现在命令行参数中（避免被ps等工具看到）
+        cmd = ["gh", "secret", "set", secret_name, "--repo", f"{username}/{repo_name}"]
+        success, _, stderr = run_command(cmd, input=secret_value)
+        return secret_name, success, stderr
+    
+    # 并发设置所有secrets，限制并发数以避免触发GitHub限流
+    with ThreadPoolExecutor(max_workers=min(8, len(secrets))) as executor:
+        futures = [executor.submit(_set_one, name, value) for name, value in secrets.items()]
+        for future in as_completed(futures):
+            secret_name, success, stderr = future.result()
             if success:
                 print(f"✅ 设置 {secret_name} 成功")
             else:
@@ -262,10 +306,9 @@ def create_deployment_summary():
     print("  - 校影")
     
     print("\n🔗 有用的链接:")
-    success, username, _ = run_command("gh api user --jq .login")
-    if success:
-        username = username.strip()
-        repo_name = "wechat-job-monitor"
+    username = get_username()
+    if username:
+        repo_name = REPO_NAME
         print(f"  - 仓库: https://github.com/{username}/{repo_name}")
         print(f"  - Actions: https://github.com/{username}/{repo_name}/actions")
         print(f"  - 设置: https://github.com/{username}/{repo_name}/settings/secrets/actions")
@@ -289,9 +332,14 @@ def main():
         sys.exit(1)
     
     try:
+        # 并行检查Git和GitHub CLI，两者互不依赖
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            git_future = executor.submit(check_git_installed)
+            gh_future = executor.submit(check_gh_cli_installed)
+        
         # 步骤1: 检查Git
         print("1️⃣ 检查Git安装...")
-        if not check_git_installed():
+        if not git_future.result():
             print("❌ Git未安装，请先安装Git")
             print("访问: https://git-scm.com/downloads")
             sys.exit(1)
@@ -299,7 +347,7 @@ def main():
         
         # 步骤2: 检查GitHub CLI
         print("\n2️⃣ 检查GitHub CLI...")
-        if not check_gh_cli_installed():
+        if not gh_future.result():
             print("⚠️  GitHub CLI未安装")
             install_choice = input("是否自动安装GitHub CLI? (y/n): ").lower().strip()
             if install_choice == 'y':
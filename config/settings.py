@@ -4,6 +4,7 @@
 系统配置文件
 """
 
+import functools
 import os
 from typing import Dict, List
 
@@ -97,6 +98,12 @@ JOB_KEYWORDS = {
     ]
 }
 
+# 保留原始顺序的关键词元组，供需要按顺序遍历的场景使用
+JOB_KEYWORDS_ORDERED = {category: tuple(keywords) for category, keywords in JOB_KEYWORDS.items()}
+
+# 关键词集合，成员判断为O(1)且不可变，可在线程间安全共享
+JOB_KEYWORDS = {category: frozenset(keywords) for category, keywords in JOB_KEYWORDS.items()}
+
 # 环境变量映射
 ENV_VARS = {
     'deepseek_api_key': 'DEEPSEEK_API_KEY',
@@ -112,15 +119,15 @@ ENV_VARS = {
     'github_token': 'GITHUB_TOKEN'
 }
 
+# 预先展开的 (配置键, 环境变量名) 序列，避免每次遍历字典
+_ENV_VAR_ITEMS = tuple(ENV_VARS.items())
+
 # 获取环境变量
+@functools.lru_cache(maxsize=None)
 def get_env_config() -> Dict:
-    """获取环境变量配置"""
-    config = {}
-    for key, env_var in ENV_VARS.items():
-        value = os.getenv(env_var)
-        if value:
-            config[key] = value
-    return config
+    """获取环境变量配置（结果会被缓存，修改环境变量后需调用 get_env_config.cache_clear()）"""
+    environ = os.environ
+    return {key: environ[env_var] for key, env_var in _ENV_VAR_ITEMS if environ.get(env_var)}
 
 # 获取完整配置
 def get_config() -> Dict:
@@ -8,35 +8,49 @@
 import os
 import sys
 import logging
+import logging.handlers
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import List, Dict
-import json
+import orjson
 
-# 添加src目录到Python路径
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+from src.rss_monitor import RSSMonitor
 
-from rss_monitor import RSSMonitor
-from ocr_processor import OCRProcessor
-from content_analyzer import ContentAnalyzer
-from job_extractor import JobExtractor
-from notification import NotificationSender
+# 同时识别图片的文章数上限（DeepSeek API的并发请求数由内容分析器的DEEPSEEK_CONCURRENCY控制）
+MAX_CONCURRENT_ARTICLES = 10
 
 # 配置日志
-def setup_logging():
-    """设置日志配置"""
+def setup_logging(timestamp: str):
+    """
+    设置日志配置
+    
+    Args:
+        timestamp: 日志文件名使用的时间戳
+    """
     log_dir = "logs"
     os.makedirs(log_dir, exist_ok=True)
     
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     log_file = os.path.join(log_dir, f"monitor_{timestamp}.log")
     
+    # 文件日志先缓存在内存中批量写入，遇到WARNING及以上级别立即刷新；
+    # 程序退出时 logging.shutdown 会自动刷新剩余日志
+    log_format = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    file_handler = logging.FileHandler(log_file, encoding='utf-8')
+    file_handler.setFormatter(logging.Formatter(log_format))
+    buffered_handler = logging.handlers.MemoryHandler(
+        capacity=512,
+        flushLevel=logging.WARNING,
+        target=file_handler
+    )
+    
     logging.basicConfig(
         level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        format=log_format,
         handlers=[
-            logging.FileHandler(log_file, encoding='utf-8'),
+            buffered_handler,
             logging.StreamHandler(sys.stdout)
-        ]
+        ],
+        force=True  # 各模块导入时已调用过basicConfig，需要替换掉默认处理器
     )
     
     return logging.getLogger(__name__)
@@ -44,16 +58,36 @@ def setup_logging():
 
 def main():
     """主函数"""
-    logger = setup_logging()
+    # 本次运行的时间戳只计算一次，供日志、结果文件名和运行记录复用
+    run_start = datetime.now()
+    ts_compact = run_start.strftime("%Y%m%d_%H%M%S")
+    ts_iso = run_start.isoformat()
+    
+    logger = setup_logging(ts_compact)
     logger.info("=" * 50)
     logger.info("微信公众号招聘信息监控系统启动")
     logger.info("=" * 50)
     
     try:
-        # 初始化各个组件
+        # 步骤1: 监控RSS源，获取新文章
+        logger.info("步骤1: 监控RSS源...")
+        rss_monitor = RSSMonitor()
+        new_articles = rss_monitor.monitor_rss_sources()
+        
+        if not new_articles:
+            logger.info("没有发现新文章，程序结束")
+            return
+        
+        logger.info(f"发现 {len(new_articles)} 篇新文章")
+        
+        # 有新文章时才导入并初始化其余组件（PaddleOCR、pandas等导入开销较大）
         logger.info("正在初始化系统组件...")
         
-        rss_monitor = RSSMonitor()
+        from src.ocr_processor import OCRProcessor
+        from src.content_analyzer import ContentAnalyzer
+        from src.job_extractor import JobExtractor
+        from src.notification import NotificationSender
+        
         ocr_processor = OCRProcessor()
         content_analyzer = ContentAnalyzer()
         job_extractor = JobExtractor()
@@ -68,40 +102,29 @@ def main():
         if not content_analyzer.is_available():
             logger.warning("内容分析器不可用，将跳过AI分析")
         
-        # 步骤1: 监控RSS源，获取新文章
-        logger.info("步骤1: 监控RSS源...")
-        new_articles = rss_monitor.monitor_rss_sources()
-        
-        if not new_articles:
-            logger.info("没有发现新文章，程序结束")
-            return
-        
-        logger.info(f"发现 {len(new_articles)} 篇新文章")
-        
-        # 步骤2: 处理文章图片，进行OCR识别
+        # 步骤2: 处理文章图片，多篇文章并发进行OCR识别
         logger.info("步骤2: 处理文章图片...")
         
         if ocr_processor.is_available():
-            processed_articles = []
-            for article in new_articles:
+            def process_article_images(article: Dict) -> Dict:
                 try:
-                    processed_article = ocr_processor.process_article_images(article)
-                    processed_articles.append(processed_article)
+                    return ocr_processor.process_article_images(article)
                 except Exception as e:
                     logger.error(f"处理文章图片失败: {e}")
-                    processed_articles.append(article)
+                    return article
             
-            new_articles = processed_articles
+            with ThreadPoolExecutor(max_workers=min(MAX_CONCURRENT_ARTICLES, len(new_articles))) as executor:
+                new_articles = list(executor.map(process_article_images, new_articles))
             logger.info("图片处理完成")
         else:
             logger.warning("跳过图片处理")
         
-        # 步骤3: 使用AI分析文章内容
+        # 步骤3: 使用AI分析文章内容。process_articles自带并发和限流，
+        # 内容完全相同的文章（多个公众号转载）只分析一次
         logger.info("步骤3: 分析文章内容...")
         
         if content_analyzer.is_available():
-            analyzed_articles = content_analyzer.process_articles(new_articles)
-            new_articles = analyzed_articles
+            new_articles = content_analyzer.process_articles(new_articles)
             logger.info("内容分析完成")
         else:
             logger.warning("跳过内容分析")
@@ -109,7 +132,9 @@ def main():
         # 步骤4: 提取招聘信息并生成报告
         logger.info("步骤4: 提取招聘信息...")
         
-        report_result = job_extractor.process_articles_and_generate_reports(new_articles)
+        # 招聘信息只提取一次，报告和通知共用
+        jobs = job_extractor.extract_all_jobs(new_articles)
+        report_result = job_extractor.process_articles_and_generate_reports(new_articles, jobs=jobs)
         
         if report_result['success']:
             logger.info(f"成功提取 {report_result['job_count']} 个招聘信息")
@@ -120,27 +145,26 @@ def main():
         # 步骤5: 发送通知
         logger.info("步骤5: 发送通知...")
         
-        # 准备汇总信息
+        # 准备汇总信息，单次遍历统计各类文章数量
+        job_related_count = confirmed_count = job_images_count = 0
+        for article in new_articles:
+            job_related_count += bool(article.get('is_job_related', False))
+            confirmed_count += bool(article.get('is_confirmed_job_posting', False))
+            job_images_count += bool(article.get('has_job_images', False))
+        
         summary = {
             'statistics': {
                 'total_articles': len(new_articles),
-                'job_related_articles': len([a for a in new_articles if a.get('is_job_related', False)]),
-                'confirmed_job_postings': len([a for a in new_articles if a.get('is_confirmed_job_posting', False)]),
-                'articles_with_job_images': len([a for a in new_articles if a.get('has_job_images', False)]),
+                'job_related_articles': job_related_count,
+                'confirmed_job_postings': confirmed_count,
+                'articles_with_job_images': job_images_count,
                 'total_positions': report_result.get('job_count', 0)
             },
             'generated_at': datetime.now().isoformat()
         }
         
-        # 提取招聘信息用于通知
-        jobs = job_extractor.extract_all_jobs(new_articles)
-        
-        # 准备附件
-        attachments = []
-        if report_result.get('files'):
-            for file_type, file_path in report_result['files'].items():
-                if os.path.exists(file_path):
-                    attachments.append(file_path)
+        # 准备附件（报告生成器只返回已成功写入的文件）
+        attachments = list(report_result.get('files', {}).values())
         
         # 发送通知
         notification_result = notification_sender.send_all_notifications(
@@ -153,9 +177,9 @@ def main():
             logger.warning("所有通知发送失败")
         
         # 保存运行结果
-        result_file = os.path.join("data", f"run_result_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+        result_file = os.path.join("data", f"run_result_{ts_compact}.json")
         run_result = {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': ts_iso,
             'summary': summary,
             'articles_count': len(new_articles),
             'jobs_count': len(jobs),
@@ -164,8 +188,8 @@ def main():
             'success': True
         }
         
-        with open(result_file, 'w', encoding='utf-8') as f:
-            json.dump(run_result, f, ensure_ascii=False, indent=2)
+        with open(result_file, 'wb') as f:
+            f.write(orjson.dumps(run_result, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
         
         logger.info("=" * 50)
         logger.info("监控任务完成")
@@ -179,16 +203,16 @@ def main():
         logger.error(f"系统运行出错: {e}", exc_info=True)
         
         # 保存错误结果
-        error_file = os.path.join("data", f"error_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+        error_file = os.path.join("data", f"error_{ts_compact}.json")
         error_result = {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': ts_iso,
             'error': str(e),
             'success': False
         }
         
         try:
-            with open(error_file, 'w', encoding='utf-8') as f:
-                json.dump(error_result, f, ensure_ascii=False, indent=2)
+            with open(error_file, 'wb') as f:
+                f.write(orjson.dumps(error_result, option=orjson.OPT_INDENT_2))
         except:
             pass
         
@@ -5,22 +5,546 @@
 使用DeepSeek API进行文本内容分析和总结
 """
 
-import json
+import copy
+import hashlib
 import logging
 import os
+import random
+import re
+import sqlite3
+import struct
+import threading
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional
+import numpy as np
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime
 import time
 
-# 配置日志
-logging.basicConfig(level=logging.INFO)
+# 日志由调用方统一配置
 logger = logging.getLogger(__name__)
 
+# 调用API前的关键词预筛：命中次数不足且不含招聘图片的文章直接跳过AI分析
+_JOB_PREFILTER_RE = re.compile(r'招聘|诚聘|急招|职位|岗位|简历|薪资|月薪|HR|实习|offer|投递|任职要求|联系人|JD', re.IGNORECASE)
+_JOB_PREFILTER_MIN_HITS = 2
+_JOB_PREFILTER_MAX_CHARS = 20000
+
+# 发送给API的正文和图片文字的字符上限，超出时保留首尾、截去中间部分
+_CONTENT_MAX_CHARS = 6000
+_IMAGE_TEXT_MAX_CHARS = 2000
+
+# 不相邻的重复行达到该长度才去重
+_DEDUP_MIN_LINE_CHARS = 20
+
+# 相关性评分解析：行首的列表序号（如"1. "）不作为评分
+_SCORE_RE = re.compile(r'(\d+(?:\.\d+)?)')
+_LIST_PREFIX_RE = re.compile(r'^\s*\d+[.、)）]\s*')
+_WHITESPACE_RE = re.compile(r'[ \t\u3000\xa0]+')
+
+
+class RateLimiter:
+    """线程安全的令牌桶限流器，按固定速率补充令牌，允许少量突发请求，并根据API返回的限流响应头自适应暂停"""
+    
+    def __init__(self, rate: float, per: float = 60.0, burst: int = 1):
+        """
+        初始化限流器
+        
+        Args:
+            rate: 每个周期允许的请求数
+            per: 周期长度(秒)
+            burst: 令牌桶容量，即允许的最大突发请求数
+        """
+        self.rate = rate
+        self.per = per
+        self.capacity = max(1, burst)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """获取一个令牌，令牌不足或处于服务端要求的暂停期时阻塞等待"""
+        if self.rate <= 0:
+            return
+        
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate / self.per)
+                self._updated = now
+                
+                if now < self._paused_until:
+                    wait = self._paused_until - now
+                elif self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                else:
+                    wait = (1 - self._tokens) * self.per / self.rate
+            
+            time.sleep(wait)
+    
+    def update(self, status_code: int, headers) -> None:
+        """
+        根据响应头调整限流：429时按Retry-After暂停，剩余额度不足10%时暂停到额度重置
+        
+        Args:
+            status_code: HTTP状态码
+            headers: 响应头
+        """
+        delay = 0.0
+        
+        if status_code == 429:
+            delay = _parse_delay(headers.get('Retry-After')) or self.per / max(self.rate, 1)
+        else:
+            remaining = _parse_delay(headers.get('X-RateLimit-Remaining-Requests', headers.get('X-RateLimit-Remaining')))
+            limit = _parse_delay(headers.get('X-RateLimit-Limit-Requests', headers.get('X-RateLimit-Limit')))
+            if remaining is not None and limit and remaining < limit * 0.1:
+                delay = _parse_delay(headers.get('X-RateLimit-Reset-Requests', headers.get('X-RateLimit-Reset'))) or 0.0
+        
+        if delay > 0:
+            with self._lock:
+                self._paused_until = max(self._paused_until, time.monotonic() + min(delay, self.per))
+                self._tokens = 0.0
+            logger.warning("触发API限流，暂停请求 %.1f 秒", delay)
+
+
+_DURATION_RE = re.compile(r'(\d+(?:\.\d+)?)(ms|h|m|s)')
+_DURATION_UNITS = {'ms': 0.001, 's': 1, 'm': 60, 'h': 3600}
+
+
+def _parse_delay(value) -> Optional[float]:
+    """
+    解析限流响应头中的数值或时长
+    
+    支持秒数（"2"）、Unix时间戳，以及"1m30s"、"500ms"形式的时长
+    
+    Args:
+        value: 响应头的值
+        
+    Returns:
+        数值或秒数，无法解析时返回None
+    """
+    if value is None:
+        return None
+    
+    try:
+        number = float(value)
+    except ValueError:
+        parts = _DURATION_RE.findall(value)
+        if not parts:
+            return None
+        return sum(float(amount) * _DURATION_UNITS[unit] for amount, unit in parts)
+    
+    # 大于一年的秒数视为重置时刻的Unix时间戳
+    if number > 365 * 86400:
+        return max(0.0, number - time.time())
+    return number
+
+
+# MinHash参数：排列数量、字符分片长度，以及固定种子生成的哈希系数（保证跨进程结果一致）
+_MINHASH_PERMUTATIONS = 64
+_MINHASH_SHINGLE_SIZE = 3
+_MINHASH_PRIME = (1 << 61) - 1
+_MINHASH_COEFFICIENTS = [
+    (rng.randrange(1, _MINHASH_PRIME), rng.randrange(0, _MINHASH_PRIME))
+    for rng in [random.Random(20240101)]
+    for _ in range(_MINHASH_PERMUTATIONS)
+]
+_MINHASH_STRUCT = struct.Struct(f'<{_MINHASH_PERMUTATIONS}Q')
+
+# 向量化计算用的系数列向量；a拆成高低32位，使每次乘法都不超出uint64
+_MINHASH_A = np.array([a for a, _ in _MINHASH_COEFFICIENTS], dtype=np.uint64)[:, None]
+_MINHASH_A_HIGH = _MINHASH_A >> np.uint64(32)
+_MINHASH_A_LOW = _MINHASH_A & np.uint64(0xFFFFFFFF)
+_MINHASH_B = np.array([b for _, b in _MINHASH_COEFFICIENTS], dtype=np.uint64)[:, None]
+
+
+def _mod_mersenne61(values: np.ndarray) -> np.ndarray:
+    """对uint64数组取模 2^61-1（利用 2^61 ≡ 1 折叠高位）"""
+    prime = np.uint64(_MINHASH_PRIME)
+    values = (values & prime) + (values >> np.uint64(61))
+    return np.where(values >= prime, values - prime, values)
+
+
+def minhash_signature(text: str) -> tuple:
+    """
+    计算文本的MinHash签名，两个签名中相同位置取值相等的比例近似于文本字符分片的Jaccard相似度
+    
+    Args:
+        text: 文本内容
+        
+    Returns:
+        签名元组
+    """
+    text = ''.join(text.split())
+    size = _MINHASH_SHINGLE_SIZE
+    hashes = {zlib.crc32(text[i:i + size].encode('utf-8')) for i in range(max(1, len(text) - size + 1))}
+    h = np.fromiter(hashes, dtype=np.uint64, count=len(hashes))
+    
+    # 对所有排列和分片一次性计算 (a*h + b) mod (2^61-1)，结果与逐个计算的整数运算完全相同：
+    # a*h = a_high*h*2^32 + a_low*h，两部分分别取模，乘2^32通过按61位折叠完成
+    high = _mod_mersenne61(_MINHASH_A_HIGH * h)
+    high = _mod_mersenne61((high >> np.uint64(29)) + ((high & np.uint64((1 << 29) - 1)) << np.uint64(32)))
+    low = _mod_mersenne61(_MINHASH_A_LOW * h)
+    values = _mod_mersenne61(high + low + _MINHASH_B)
+    return tuple(values.min(axis=1).tolist())
+
+
+def _first_json(text: str) -> Optional[str]:
+    """
+    扫描提取文本中第一个括号配平且能解析的JSON对象，忽略字符串内的括号
+    
+    Args:
+        text: 模型回复内容
+        
+    Returns:
+        JSON对象字符串，没有有效的对象时返回None
+    """
+    start = text.find('{')
+    while start >= 0:
+        depth = 0
+        in_string = escaped = False
+        for index in range(start, len(text)):
+            char = text[index]
+            if in_string:
+                if escaped:
+                    escaped = False
+                elif char == '\\':
+                    escaped = True
+                elif char == '"':
+                    in_string = False
+            elif char == '"':
+                in_string = True
+            elif char == '{':
+                depth += 1
+            elif char == '}':
+                depth -= 1
+                if depth == 0:
+                    candidate = text[start:index + 1]
+                    try:
+                        orjson.loads(candidate)
+                        return candidate
+                    except orjson.JSONDecodeError:
+                        break  # 说明文字中的括号，从下一个"{"重新扫描
+        else:
+            return None  # 括号未配平（回复被截断）
+        
+        start = text.find('{', start + 1)
+    
+    return None
+
+
+# 文章总结的系统提示词
+_SUMMARIZE_SYSTEM = """你是一个专业的招聘信息分析助手。请分析以下微信公众号文章内容，判断是否包含招聘信息，并提供详细的总结。
+
+请按以下格式回复：
+1. 是否包含招聘信息（是/否）
+2. 文章主题总结（1-2句话）
+3. 如果包含招聘信息，请提取：
+   - 招聘岗位
+   - 公司/机构名称
+   - 工作地点
+   - 薪资待遇
+   - 任职要求
+   - 联系方式
+4. 重要信息摘要（3-5个要点）"""
+
+# 招聘相关性分析的系统提示词
+_RELEVANCE_SYSTEM = """你是一个专业的文本分析助手。请分析以下文本是否与招聘求职相关，并给出相关性评分。
+
+请按以下格式回复：
+1. 相关性评分（0-1之间的数字，0表示完全不相关，1表示高度相关）
+2. 主要原因（简短说明）
+3. 关键词列表（提取到的相关关键词）"""
+
+# 招聘信息提取的系统提示词
+_EXTRACT_SYSTEM = """你是一个专业的招聘信息提取助手。请从以下内容中提取结构化的招聘信息。
+
+请严格按照以下JSON格式回复，如果某个字段没有信息则填写"未提及"：
+{
+    "is_job_posting": true/false,
+    "company_name": "公司名称",
+    "positions": [
+        {
+            "job_title": "职位名称",
+            "department": "部门",
+            "location": "工作地点",
+            "salary": "薪资待遇",
+            "employment_type": "全职/兼职/实习",
+            "requirements": [
+                "任职要求1",
+                "任职要求2"
+            ],
+            "responsibilities": [
+                "工作职责1",
+                "工作职责2"
+            ],
+            "benefits": [
+                "福利待遇1",
+                "福利待遇2"
+            ]
+        }
+    ],
+    "contact_info": {
+        "contact_person": "联系人",
+        "phone": "联系电话",
+        "email": "邮箱地址",
+        "wechat": "微信号",
+        "address": "公司地址",
+        "application_method": "应聘方式"
+    },
+    "deadline": "截止日期",
+    "additional_info": "其他重要信息"
+}
+
+请确保返回的是有效的JSON格式。"""
+
+# 招聘信息提取使用JSON模式及其输出令牌上限
+_JSON_RESPONSE_FORMAT = {"type": "json_object"}
+_EXTRACT_MAX_TOKENS = 1200
+
+# 预先构建的系统消息，各次请求共用同一对象（只读，不可修改）
+_SUMMARIZE_SYSTEM_MESSAGE = {"role": "system", "content": _SUMMARIZE_SYSTEM}
+_RELEVANCE_SYSTEM_MESSAGE = {"role": "system", "content": _RELEVANCE_SYSTEM}
+_EXTRACT_SYSTEM_MESSAGE = {"role": "system", "content": _EXTRACT_SYSTEM}
+
+
+class ResponseCache:
+    """基于SQLite的API响应缓存，以请求内容的哈希为键，支持过期时间，可在线程间共享"""
+    
+    def __init__(self, cache_dir: str, ttl: int = 604800):
+        """
+        初始化响应缓存
+        
+        Args:
+            cache_dir: 缓存目录
+            ttl: 缓存有效期(秒)
+        """
+        os.makedirs(cache_dir, exist_ok=True)
+        self.path = os.path.join(cache_dir, "deepseek_cache.sqlite3")
+        self.ttl = ttl
+        self.stats = {'hits': 0, 'misses': 0, 'similar_hits': 0}
+        
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+            # 近似重复查找用的签名表，context区分不同的提示词和请求参数
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS signatures ("
+                "key TEXT PRIMARY KEY, context TEXT NOT NULL, signature BLOB NOT NULL, expires_at REAL NOT NULL)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_signatures_context ON signatures (context)")
+            # 清理已过期的缓存
+            now = time.time()
+            self._conn.execute("DELETE FROM responses WHERE expires_at < ?", (now,))
+            self._conn.execute("DELETE FROM signatures WHERE expires_at < ?", (now,))
+    
+    @staticmethod
+    def make_key(request: Dict) -> str:
+        """
+        计算请求的缓存键
+        
+        Args:
+            request: 决定响应内容的请求参数
+            
+        Returns:
+            缓存键
+        """
+        return hashlib.sha256(orjson.dumps(request, option=orjson.OPT_SORT_KEYS)).hexdigest()
+    
+    def get(self, key: str) -> Optional[Dict]:
+        """
+        读取缓存
+        
+        Args:
+            key: 缓存键
+            
+        Returns:
+            缓存的响应，未命中或已过期时返回None
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM responses WHERE key = ? AND expires_at >= ?",
+                (key, time.time())
+            ).fetchone()
+            self.stats['hits' if row else 'misses'] += 1
+        
+        return orjson.loads(row[0]) if row else None
+    
+    def find_similar(self, context: str, signature: tuple, threshold: float) -> Optional[Dict]:
+        """
+        查找内容近似重复的请求的缓存响应
+        
+        Args:
+            context: 请求上下文键（提示词和请求参数相同才可复用）
+            signature: 请求内容的MinHash签名
+            threshold: 相似度阈值
+            
+        Returns:
+            最相似且达到阈值的缓存响应，没有时返回None
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT key, signature FROM signatures WHERE context = ? AND expires_at >= ?",
+                (context, time.time())
+            ).fetchall()
+        
+        if not rows:
+            return None
+        
+        # 所有候选签名拼成一个矩阵，一次向量化比较算出与每条缓存的相似度
+        signatures = np.frombuffer(b''.join(row[1] for row in rows), dtype='<u8').reshape(len(rows), -1)
+        scores = (signatures == np.asarray(signature, dtype=np.uint64)).sum(axis=1) / len(signature)
+        
+        # 相似度相同时取较晚写入的缓存
+        best = len(scores) - 1 - int(np.argmax(scores[::-1]))
+        if scores[best] < threshold:
+            return None
+        best_key = rows[best][0]
+        
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM responses WHERE key = ? AND expires_at >= ?",
+                (best_key, time.time())
+            ).fetchone()
+            if row:
+                self.stats['similar_hits'] += 1
+        
+        return orjson.loads(row[0]) if row else None
+    
+    def set(self, key: str, value: Dict, context: str = None, signature: tuple = None):
+        """
+        写入缓存
+        
+        Args:
+            key: 缓存键
+            value: 响应内容
+            context: 请求上下文键，与signature一起提供时用于近似重复查找
+            signature: 请求内容的MinHash签名
+        """
+        data = orjson.dumps(value).decode('utf-8')
+        expires_at = time.time() + self.ttl
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, data, expires_at)
+            )
+            if context is not None and signature is not None:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO signatures (key, context, signature, expires_at) VALUES (?, ?, ?, ?)",
+                    (key, context, _MINHASH_STRUCT.pack(*signature), expires_at)
+                )
+
+
+class AnalysisCheckpoint:
+    """按文章记录分析结果的JSONL检查点，程序中断后重新运行时可跳过已分析的文章"""
+    
+    # 检查点中保存的文章分析字段
+    FIELDS = ('ai_summary', 'job_extraction', 'is_confirmed_job_posting')
+    
+    def __init__(self, path: str):
+        """
+        初始化检查点，加载已有记录
+        
+        Args:
+            path: 检查点文件路径
+        """
+        self.path = path
+        self._records = {}
+        self._lock = threading.Lock()
+        
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        if os.path.exists(path):
+            with open(path, 'rb') as f:
+                for line in f:
+                    try:
+                        record = orjson.loads(line)
+                    except orjson.JSONDecodeError:
+                        continue  # 写入中断留下的不完整行
+                    self._records[record['id']] = record
+        
+        self._file = open(path, 'ab')
+    
+    @staticmethod
+    def article_id(article: Dict) -> str:
+        """
+        计算文章的唯一标识
+        
+        Args:
+            article: 文章信息
+            
+        Returns:
+            RSS条目的guid，没有时为链接和标题的MD5
+        """
+        guid = article.get('guid')
+        if guid:
+            return guid
+        key = (article.get('link') or '') + (article.get('title') or '')
+        return hashlib.md5(key.encode('utf-8')).hexdigest()
+    
+    def restore(self, article: Dict) -> bool:
+        """
+        将已保存的分析结果恢复到文章中
+        
+        Args:
+            article: 文章信息
+            
+        Returns:
+            是否找到该文章的记录
+        """
+        record = self._records.get(self.article_id(article))
+        if record is None:
+            return False
+        
+        for field in self.FIELDS:
+            if field in record:
+                article[field] = record[field]
+        return True
+    
+    def save(self, article: Dict):
+        """
+        追加保存文章的分析结果
+        
+        Args:
+            article: 已分析的文章信息
+        """
+        record = {'id': self.article_id(article)}
+        for field in self.FIELDS:
+            if field in article:
+                record[field] = article[field]
+        line = orjson.dumps(record) + b'\n'
+        
+        with self._lock:
+            self._records[record['id']] = record
+            self._file.write(line)
+            self._file.flush()
+    
+    def close(self):
+        """关闭检查点文件"""
+        with self._lock:
+            self._file.close()
+
 
 class ContentAnalyzer:
     """内容分析器，使用DeepSeek API进行文本分析"""
     
+    # 温度不高于该值的请求结果会被缓存
+    CACHEABLE_TEMPERATURE = 0.3
+    
+    # 内容相似度达到该值时复用近似重复请求的缓存结果
+    SIMILARITY_THRESHOLD = float(os.getenv('DEEPSEEK_SIMILARITY_THRESHOLD', '0.95'))
+    
     def __init__(self, api_key: str = None, base_url: str = "https://api.deepseek.com"):
         """
         初始化内容分析器
@@ -33,15 +557,81 @@ class ContentAnalyzer:
         self.base_url = base_url
         self.model = "deepseek-chat"
         
+        # 并发请求数和每分钟请求数上限
+        self.concurrency = max(1, int(os.getenv('DEEPSEEK_CONCURRENCY', '8')))
+        self.rate_limiter = RateLimiter(
+            rate=float(os.getenv('DEEPSEEK_RPM', '60')),
+            per=60.0,
+            burst=self.concurrency
+        )
+        
+        # 同一篇文章的总结和招聘信息提取互不依赖，提取请求提交到该线程池与总结并行
+        self._executor = ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix='deepseek')
+        
+        # 响应缓存，低温度的请求结果基本确定，重复内容可以直接复用
+        self.cache = None
+        try:
+            self.cache = ResponseCache(
+                os.getenv('DEEPSEEK_CACHE_DIR', os.path.join('data', 'cache')),
+                ttl=int(os.getenv('DEEPSEEK_CACHE_TTL', '604800'))
+            )
+        except (OSError, sqlite3.Error) as e:
+            logger.warning("API响应缓存不可用: %s", e)
+        
+        # 文章分析检查点，中断后重新运行时跳过已成功分析的文章。检查点没有过期时间，
+        # 只在设置了ANALYZER_CKPT（检查点文件路径）时启用，恢复中断的运行后应删除该文件
+        self.checkpoint = None
+        checkpoint_path = os.getenv('ANALYZER_CKPT')
+        if checkpoint_path:
+            try:
+                self.checkpoint = AnalysisCheckpoint(checkpoint_path)
+            except OSError as e:
+                logger.warning("文章分析检查点不可用: %s", e)
+        
         # 请求头
         self.headers = {
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json"
         }
         
+        # 复用连接的HTTP会话，避免每次请求重新建立TCP/TLS连接；对限流和服务端错误自动退避重试。
+        # 所有请求都发往同一主机，连接池大小与并发数（文章线程和提取线程各一份）匹配，
+        # 池满时阻塞等待空闲连接，而不是临时新建随后被丢弃的连接
+        self._session = requests.Session()
+        self._session.headers.update(self.headers)
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=self.concurrency * 2,
+            pool_block=True,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=frozenset(['POST']),
+                raise_on_status=False
+            )
+        )
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        
+        # API密钥在实例生命周期内不变，可用状态只需判断一次
+        self._available = self.api_key is not None
         if not self.api_key:
             logger.warning("DeepSeek API密钥未设置")
     
+    def close(self):
+        """关闭HTTP会话和线程池，释放连接"""
+        self._executor.shutdown(wait=True)
+        self._session.close()
+        if self.checkpoint is not None:
+            self.checkpoint.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
     def is_available(self) -> bool:
         """
         检查API是否可用
@@ -49,9 +639,11 @@ class ContentAnalyzer:
         Returns:
             是否可用
         """
-        return self.api_key is not None
+        return self._available
     
-    def call_deepseek_api(self, messages: List[Dict], max_tokens: int = 1000, temperature: float = 0.7) -> Optional[Dict]:
+    def call_deepseek_api(self, messages: List[Dict], max_tokens: int = 1000, temperature: float = 0.7,
+                          stream: bool = False, response_format: Optional[Dict] = None,
+                          allow_similar: bool = False) -> Optional[Dict]:
         """
         调用DeepSeek API
         
@@ -59,14 +651,43 @@ class ContentAnalyzer:
             messages: 消息列表
             max_tokens: 最大令牌数
             temperature: 随机性控制
+            stream: 是否以流式方式接收响应，服务端边生成边发送，长回复不会因等待整个响应触发读取超时
+            response_format: 响应格式，如 {"type": "json_object"} 要求模型只输出JSON
+            allow_similar: 是否允许复用内容近似重复的请求的缓存结果。只适用于总结这类自由文本；
+                结构化提取（电话、薪资等字段）即使内容高度相似也可能不同，只能精确命中
             
         Returns:
             API响应结果
         """
-        if not self.is_available():
+        if not self._available:
             logger.error("DeepSeek API不可用")
             return None
         
+        # 只缓存低温度（输出基本确定）的请求
+        cache_key = context_key = signature = None
+        if self.cache is not None and temperature <= self.CACHEABLE_TEMPERATURE:
+            request = {
+                'model': self.model,
+                'messages': messages,
+                'max_tokens': max_tokens,
+                'temperature': temperature
+            }
+            if response_format is not None:
+                request['response_format'] = response_format
+            cache_key = ResponseCache.make_key(request)
+            cached = self.cache.get(cache_key)
+            
+            # 精确匹配未命中时，查找提示词相同、用户内容近似重复的历史请求（如转载的招聘启事）
+            if (cached is None and allow_similar and response_format is None and
+                    messages and messages[-1].get('role') == 'user'):
+                context_key = ResponseCache.make_key({**request, 'messages': messages[:-1]})
+                signature = minhash_signature(messages[-1].get('content', ''))
+                cached = self.cache.find_similar(context_key, signature, self.SIMILARITY_THRESHOLD)
+            
+            if cached is not None:
+                logger.info("DeepSeek API缓存命中")
+                return cached
+        
         try:
             url = f"{self.base_url}/chat/completions"
             
@@ -75,61 +696,148 @@ class ContentAnalyzer:
                 "messages": messages,
                 "max_tokens": max_tokens,
                 "temperature": temperature,
-                "stream": False
+                "stream": stream
             }
+            if stream:
+                payload["stream_options"] = {"include_usage": True}
+            if response_format is not None:
+                payload["response_format"] = response_format
             
-            logger.info(f"调用DeepSeek API: {url}")
+            logger.debug("调用DeepSeek API: %s", url)
             
-            response = requests.post(
+            self.rate_limiter.acquire()
+            with self._session.post(
                 url,
-                headers=self.headers,
-                json=payload,
-                timeout=30
-            )
-            
-            response.raise_for_status()
-            result = response.json()
+                data=orjson.dumps(payload),  # 会话请求头已包含Content-Type: application/json
+                timeout=(5, 30),  # 连接超时, 读取超时
+                stream=stream
+            ) as response:
+                self.rate_limiter.update(response.status_code, response.headers)
+                response.raise_for_status()
+                if stream:
+                    result = self._read_stream(response)
+                else:
+                    result = orjson.loads(response.content)
             
-            if 'choices' in result and len(result['choices']) > 0:
-                return result
-            else:
-                logger.error(f"API响应格式异常: {result}")
-                return None
-                
         except requests.exceptions.RequestException as e:
-            logger.error(f"API请求失败: {e}")
+            logger.error("API请求失败: %s", e)
             return None
-        except json.JSONDecodeError as e:
-            logger.error(f"API响应解析失败: {e}")
+        except orjson.JSONDecodeError as e:
+            logger.error("API响应解析失败: %s", e)
             return None
-        except Exception as e:
-            logger.error(f"API调用异常: {e}")
+        
+        # 完整校验响应结构，调用方可以直接读取 result['choices'][0]['message']['content']
+        choices = result.get('choices') if isinstance(result, dict) else None
+        first = choices[0] if isinstance(choices, list) and choices else None
+        message = first.get('message') if isinstance(first, dict) else None
+        if not isinstance(message, dict) or not isinstance(message.get('content'), str):
+            logger.error("API响应格式异常: %s", result)
             return None
+        
+        if cache_key is not None:
+            try:
+                self.cache.set(cache_key, result, context=context_key, signature=signature)
+            except sqlite3.Error as e:
+                logger.warning("写入API响应缓存失败: %s", e)
+        return result
     
-    def summarize_article(self, article: Dict) -> Dict:
+    @staticmethod
+    def _read_stream(response: requests.Response) -> Dict:
         """
-        总结文章内容
+        读取SSE流式响应并拼接为与非流式响应相同结构的结果
+        
+        一直读到流结束：未读完就关闭的响应不能归还连接池，下次请求要重新建立TLS连接；
+        而JSON模式下对象要到生成结束才闭合，提前停止读取也节省不了时间
         
         Args:
-            article: 文章信息
+            response: 流式HTTP响应
             
         Returns:
-            总结结果
+            API响应结果
         """
-        if not self.is_available():
-            return {
-                'success': False,
-                'error': 'DeepSeek API不可用',
-                'summary': ''
-            }
+        parts = []
+        usage = {}
+        finish_reason = None
         
-        try:
-            title = article.get('title', '')
-            content = article.get('full_content', '')
-            image_text = article.get('image_text', '')
+        for line in response.iter_lines():
+            if not line.startswith(b'data:'):
+                continue
+            data = line[5:].strip()
+            if data == b'[DONE]':
+                continue
             
-            # 构建分析内容
-            analysis_content = f"""
+            chunk = orjson.loads(data)
+            usage = chunk.get('usage') or usage
+            if not chunk.get('choices'):
+                continue
+            
+            choice = chunk['choices'][0]
+            finish_reason = choice.get('finish_reason') or finish_reason
+            parts.append((choice.get('delta') or {}).get('content') or '')
+        
+        return {
+            'choices': [{
+                'index': 0,
+                'message': {'role': 'assistant', 'content': ''.join(parts)},
+                'finish_reason': finish_reason
+            }],
+            'usage': usage
+        }
+    
+    @staticmethod
+    def _compact(text: str, max_chars: int = _CONTENT_MAX_CHARS) -> str:
+        """
+        压缩文本：合并空白、去掉空行和重复行（连续重复的行，以及反复出现的横幅等长行），超长时截去中间部分
+        
+        Args:
+            text: 原始文本
+            max_chars: 最大字符数
+            
+        Returns:
+            压缩后的文本
+        """
+        if not text:
+            return ''
+        
+        # 空白合并对整篇文本做一次正则替换，不再逐行调用（字符类不含换行符，分行结果不变）。
+        # 连续重复的行只保留一行；不相邻的重复行只去掉较长的（如横幅、声明），
+        # 各职位下重复出现的短标题（如“任职要求：”）需要保留，否则不同职位的内容会混在一起
+        seen = set()
+        lines = []
+        for line in _WHITESPACE_RE.sub(' ', text).splitlines():
+            line = line.strip()
+            if not line or (lines and line == lines[-1]):
+                continue
+            if len(line) >= _DEDUP_MIN_LINE_CHARS:
+                if line in seen:
+                    continue
+                seen.add(line)
+            lines.append(line)
+        text = '\n'.join(lines)
+        
+        if len(text) <= max_chars:
+            return text
+        
+        # 招聘信息多集中在文章开头和结尾，保留前2/3和后1/3
+        head = max_chars * 2 // 3
+        tail = max_chars - head
+        return text[:head] + '\n…[中间内容已省略]…\n' + text[-tail:]
+    
+    def _build_analysis_content(self, article: Dict) -> str:
+        """
+        构建发送给API的文章内容
+        
+        Args:
+            article: 文章信息
+            
+        Returns:
+            包含标题、正文和图片文字的分析内容
+        """
+        title = article.get('title', '')
+        content = self._compact(article.get('full_content', ''))
+        image_text = self._compact(article.get('image_text', ''), _IMAGE_TEXT_MAX_CHARS)
+        
+        return f"""
 文章标题: {title}
 
 文章内容:
@@ -138,53 +846,50 @@ class ContentAnalyzer:
 图片文字:
 {image_text}
 """
+    
+    def summarize_article(self, article: Dict) -> Dict:
+        """
+        总结文章内容
+        
+        Args:
+            article: 文章信息
             
-            # 构建提示词
-            system_prompt = """你是一个专业的招聘信息分析助手。请分析以下微信公众号文章内容，判断是否包含招聘信息，并提供详细的总结。
-
-请按以下格式回复：
-1. 是否包含招聘信息（是/否）
-2. 文章主题总结（1-2句话）
-3. 如果包含招聘信息，请提取：
-   - 招聘岗位
-   - 公司/机构名称
-   - 工作地点
-   - 薪资待遇
-   - 任职要求
-   - 联系方式
-4. 重要信息摘要（3-5个要点）"""
-            
-            messages = [
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": analysis_content}
-            ]
-            
-            # 调用API
-            result = self.call_deepseek_api(messages, max_tokens=1500, temperature=0.3)
-            
-            if result and 'choices' in result:
-                summary = result['choices'][0]['message']['content']
-                
-                return {
-                    'success': True,
-                    'summary': summary,
-                    'usage': result.get('usage', {}),
-                    'model': self.model
-                }
-            else:
-                return {
-                    'success': False,
-                    'error': 'API响应异常',
-                    'summary': ''
-                }
-                
-        except Exception as e:
-            logger.error(f"文章总结失败: {e}")
+        Returns:
+            总结结果
+        """
+        if not self._available:
             return {
                 'success': False,
-                'error': str(e),
+                'error': 'DeepSeek API不可用',
                 'summary': ''
             }
+        
+        # 构建分析内容
+        analysis_content = self._build_analysis_content(article)
+        
+        messages = [
+            _SUMMARIZE_SYSTEM_MESSAGE,
+            {"role": "user", "content": analysis_content}
+        ]
+        
+        # 调用API（请求和响应解析错误已在call_deepseek_api中处理）。总结中同样包含薪资和联系方式，
+        # 可能是招聘信息的文章只复用精确命中的缓存，近似重复的复用只用于其余文章
+        result = self.call_deepseek_api(messages, max_tokens=1500, temperature=0.3,
+                                         allow_similar=not self._needs_extraction(article))
+        
+        if not result:
+            return {
+                'success': False,
+                'error': 'API响应异常',
+                'summary': ''
+            }
+        
+        return {
+            'success': True,
+            'summary': result['choices'][0]['message'].get('content') or '',
+            'usage': result.get('usage', {}),
+            'model': self.model
+        }
     
     def extract_job_info(self, article: Dict) -> Dict:
         """
@@ -196,129 +901,56 @@ class ContentAnalyzer:
         Returns:
             提取结果
         """
-        if not self.is_available():
+        if not self._available:
             return {
                 'success': False,
                 'error': 'DeepSeek API不可用',
                 'job_info': {}
             }
         
-        try:
-            title = article.get('title', '')
-            content = article.get('full_content', '')
-            image_text = article.get('image_text', '')
-            
-            # 构建分析内容
-            analysis_content = f"""
-文章标题: {title}
-
-文章内容:
-{content}
-
-图片文字:
-{image_text}
-"""
-            
-            # 构建提示词
-            system_prompt = """你是一个专业的招聘信息提取助手。请从以下内容中提取结构化的招聘信息。
-
-请严格按照以下JSON格式回复，如果某个字段没有信息则填写"未提及"：
-{
-    "is_job_posting": true/false,
-    "company_name": "公司名称",
-    "positions": [
-        {
-            "job_title": "职位名称",
-            "department": "部门",
-            "location": "工作地点",
-            "salary": "薪资待遇",
-            "employment_type": "全职/兼职/实习",
-            "requirements": [
-                "任职要求1",
-                "任职要求2"
-            ],
-            "responsibilities": [
-                "工作职责1",
-                "工作职责2"
-            ],
-            "benefits": [
-                "福利待遇1",
-                "福利待遇2"
-            ]
-        }
-    ],
-    "contact_info": {
-        "contact_person": "联系人",
-        "phone": "联系电话",
-        "email": "邮箱地址",
-        "wechat": "微信号",
-        "address": "公司地址",
-        "application_method": "应聘方式"
-    },
-    "deadline": "截止日期",
-    "additional_info": "其他重要信息"
-}
-
-请确保返回的是有效的JSON格式。"""
-            
-            messages = [
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": analysis_content}
-            ]
-            
-            # 调用API
-            result = self.call_deepseek_api(messages, max_tokens=2000, temperature=0.1)
-            
-            if result and 'choices' in result:
-                response_content = result['choices'][0]['message']['content']
-                
-                # 尝试解析JSON
-                try:
-                    # 提取JSON部分
-                    json_start = response_content.find('{')
-                    json_end = response_content.rfind('}') + 1
-                    
-                    if json_start >= 0 and json_end > json_start:
-                        json_str = response_content[json_start:json_end]
-                        job_info = json.loads(json_str)
-                        
-                        return {
-                            'success': True,
-                            'job_info': job_info,
-                            'raw_response': response_content,
-                            'usage': result.get('usage', {})
-                        }
-                    else:
-                        logger.warning("响应中未找到有效的JSON格式")
-                        return {
-                            'success': False,
-                            'error': 'JSON格式解析失败',
-                            'job_info': {},
-                            'raw_response': response_content
-                        }
-                        
-                except json.JSONDecodeError as e:
-                    logger.error(f"JSON解析失败: {e}")
-                    return {
-                        'success': False,
-                        'error': f'JSON解析失败: {e}',
-                        'job_info': {},
-                        'raw_response': response_content
-                    }
-            else:
-                return {
-                    'success': False,
-                    'error': 'API响应异常',
-                    'job_info': {}
-                }
-                
-        except Exception as e:
-            logger.error(f"招聘信息提取失败: {e}")
+        # 构建分析内容
+        analysis_content = self._build_analysis_content(article)
+        
+        messages = [
+            _EXTRACT_SYSTEM_MESSAGE,
+            {"role": "user", "content": analysis_content}
+        ]
+        
+        # 调用API，JSON模式避免模型输出多余的说明文字；流式接收，生成较慢时不会触发读取超时
+        result = self.call_deepseek_api(
+            messages,
+            max_tokens=_EXTRACT_MAX_TOKENS,
+            temperature=0.0,
+            stream=True,
+            response_format=_JSON_RESPONSE_FORMAT
+        )
+        
+        if not result:
             return {
                 'success': False,
-                'error': str(e),
+                'error': 'API响应异常',
                 'job_info': {}
             }
+        
+        response_content = result['choices'][0]['message'].get('content') or ''
+        
+        # 提取第一个完整且有效的JSON对象
+        json_str = _first_json(response_content)
+        if json_str is None:
+            logger.warning("响应中未找到有效的JSON格式")
+            return {
+                'success': False,
+                'error': 'JSON格式解析失败',
+                'job_info': {},
+                'raw_response': response_content
+            }
+        
+        return {
+            'success': True,
+            'job_info': orjson.loads(json_str),
+            'raw_response': response_content,
+            'usage': result.get('usage', {})
+        }
     
     def analyze_job_relevance(self, text: str) -> Dict:
         """
@@ -330,67 +962,208 @@ class ContentAnalyzer:
         Returns:
             相关性分析结果
         """
-        if not self.is_available():
+        if not self._available:
             return {
                 'success': False,
                 'error': 'DeepSeek API不可用',
                 'relevance_score': 0.0
             }
         
-        try:
-            system_prompt = """你是一个专业的文本分析助手。请分析以下文本是否与招聘求职相关，并给出相关性评分。
-
-请按以下格式回复：
-1. 相关性评分（0-1之间的数字，0表示完全不相关，1表示高度相关）
-2. 主要原因（简短说明）
-3. 关键词列表（提取到的相关关键词）"""
-            
-            messages = [
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": text}
-            ]
-            
-            result = self.call_deepseek_api(messages, max_tokens=500, temperature=0.2)
-            
-            if result and 'choices' in result:
-                response = result['choices'][0]['message']['content']
-                
-                # 简单解析评分
-                score = 0.0
-                try:
-                    lines = response.split('\n')
-                    for line in lines:
-                        if '评分' in line or '分' in line:
-                            import re
-                            score_match = re.search(r'(\d+\.?\d*)', line)
-                            if score_match:
-                                score = float(score_match.group(1))
-                                if score > 1:
-                                    score = score / 10  # 如果是0-10分制，转换为0-1
-                                break
-                except:
-                    pass
-                
-                return {
-                    'success': True,
-                    'relevance_score': score,
-                    'analysis': response,
-                    'usage': result.get('usage', {})
-                }
-            else:
-                return {
-                    'success': False,
-                    'error': 'API响应异常',
-                    'relevance_score': 0.0
-                }
-                
-        except Exception as e:
-            logger.error(f"相关性分析失败: {e}")
+        messages = [
+            _RELEVANCE_SYSTEM_MESSAGE,
+            {"role": "user", "content": text}
+        ]
+        
+        result = self.call_deepseek_api(messages, max_tokens=500, temperature=0.2)
+        
+        if not result:
             return {
                 'success': False,
-                'error': str(e),
+                'error': 'API响应异常',
                 'relevance_score': 0.0
             }
+        
+        response = result['choices'][0]['message'].get('content') or ''
+        
+        # 简单解析评分，未匹配到时为0.0
+        score = 0.0
+        for line in response.split('\n'):
+            if '分' in line:  # 评分、分数
+                score_match = _SCORE_RE.search(_LIST_PREFIX_RE.sub('', line))
+                if score_match:
+                    score = float(score_match.group(1))
+                    if score > 1:
+                        score = score / 10  # 如果是0-10分制，转换为0-1
+                    break
+        
+        return {
+            'success': True,
+            'relevance_score': score,
+            'analysis': response,
+            'usage': result.get('usage', {})
+        }
+    
+    def _needs_analysis(self, article: Dict) -> bool:
+        """
+        判断文章是否需要调用API分析：明显与招聘无关的文章直接写入跳过结果，
+        上次运行中断前已分析过的文章从检查点恢复结果
+        
+        Args:
+            article: 文章信息
+            
+        Returns:
+            是否需要调用API
+        """
+        # 明显与招聘无关的文章不调用API；可能包含招聘信息的文章（招聘相关、有招聘图片、标题含“招聘”）
+        # 无论关键词命中多少都要分析，预筛只用于其余文章
+        if not self._needs_extraction(article) and not self._passes_prefilter(article):
+            article['ai_summary'] = {'success': True, 'summary': '', 'skipped': 'no_job_keywords'}
+            article['is_confirmed_job_posting'] = False
+            return False
+        
+        # 上次运行中断前已分析过的文章直接恢复结果
+        if self.checkpoint is not None and self.checkpoint.restore(article):
+            return False
+        
+        return True
+    
+    @staticmethod
+    def _needs_extraction(article: Dict) -> bool:
+        """判断文章是否可能包含招聘信息，需要提取招聘信息"""
+        return bool(
+            article.get('is_job_related', False) or 
+            article.get('has_job_images', False) or 
+            '招聘' in article.get('title', '')
+        )
+    
+    def _apply_results(self, article: Dict, summary_result: Dict, job_info_result: Optional[Dict]):
+        """
+        写入文章的分析结果，并记录到检查点
+        
+        Args:
+            article: 文章信息
+            summary_result: 总结结果
+            job_info_result: 招聘信息提取结果，未提取时为None
+        """
+        article['ai_summary'] = summary_result
+        
+        if job_info_result is not None:
+            article['job_extraction'] = job_info_result
+            
+            # 更新招聘相关标记
+            if job_info_result.get('success') and job_info_result.get('job_info', {}).get('is_job_posting'):
+                article['is_confirmed_job_posting'] = True
+            else:
+                article['is_confirmed_job_posting'] = False
+        else:
+            article['is_confirmed_job_posting'] = False
+        
+        # 只记录成功的分析结果，失败的文章在重新运行时会再次分析
+        if (self.checkpoint is not None and summary_result.get('success') and
+                article.get('job_extraction', {}).get('success', True)):
+            self.checkpoint.save(article)
+    
+    def process_article(self, article: Dict) -> Dict:
+        """
+        处理单篇文章：总结内容，并对可能的招聘文章提取招聘信息
+        
+        Args:
+            article: 文章信息
+            
+        Returns:
+            处理后的文章信息
+        """
+        if not self._needs_analysis(article):
+            return article
+        
+        # 如果文章可能包含招聘信息，在总结的同时并行提取招聘信息
+        extraction = None
+        if self._needs_extraction(article):
+            extraction = self._executor.submit(self.extract_job_info, article)
+        
+        # 文章总结
+        summary_result = self.summarize_article(article)
+        job_info_result = extraction.result() if extraction is not None else None
+        
+        self._apply_results(article, summary_result, job_info_result)
+        return article
+    
+    @staticmethod
+    def _passes_prefilter(article: Dict) -> bool:
+        """
+        关键词预筛，判断文章是否值得调用API分析
+        
+        Args:
+            article: 文章信息
+            
+        Returns:
+            招聘关键词命中次数是否达到阈值
+        """
+        text = (
+            (article.get('title') or '') +
+            (article.get('full_content') or '') +
+            (article.get('image_text') or '')
+        )[:_JOB_PREFILTER_MAX_CHARS]
+        
+        hits = 0
+        for _ in _JOB_PREFILTER_RE.finditer(text):
+            hits += 1
+            if hits >= _JOB_PREFILTER_MIN_HITS:
+                return True
+        return False
+    
+    @staticmethod
+    def _dedup_key(article: Dict) -> bytes:
+        """
+        计算文章的去重键，影响分析请求和结果的字段都相同的文章视为重复
+        
+        Args:
+            article: 文章信息
+            
+        Returns:
+            去重键
+        """
+        data = orjson.dumps([
+            article.get('title') or '',
+            article.get('full_content') or '',
+            article.get('image_text') or '',
+            bool(article.get('is_job_related', False)),
+            bool(article.get('has_job_images', False))
+        ])
+        return hashlib.blake2b(data, digest_size=16).digest()
+    
+    def _process_unique(self, articles: List[Dict], process) -> List[Dict]:
+        """
+        对内容不重复的文章调用process处理，内容完全相同的文章（如多个公众号转载同一篇）
+        只分析一次，结果再复制给其余文章
+        
+        Args:
+            articles: 文章列表
+            process: 处理不重复文章列表的函数，返回与之一一对应的处理结果
+            
+        Returns:
+            处理后的文章列表
+        """
+        groups = {}
+        for index, article in enumerate(articles):
+            groups.setdefault(self._dedup_key(article), []).append(index)
+        if len(groups) < len(articles):
+            logger.info("%d 篇文章内容重复，只分析 %d 篇", len(articles) - len(groups), len(groups))
+        
+        unique_results = process([articles[indices[0]] for indices in groups.values()])
+        
+        processed_articles = list(articles)
+        for indices, result in zip(groups.values(), unique_results):
+            processed_articles[indices[0]] = result
+            for index in indices[1:]:
+                duplicate = articles[index]
+                for field in AnalysisCheckpoint.FIELDS:
+                    if field in result:
+                        # 深拷贝，生成报告时会修改职位信息，各文章不能共用同一对象
+                        duplicate[field] = copy.deepcopy(result[field])
+        
+        logger.info("文章分析完成，共处理 %d 篇文章", len(processed_articles))
+        return processed_articles
     
     def process_articles(self, articles: List[Dict]) -> List[Dict]:
         """
@@ -402,48 +1175,36 @@ class ContentAnalyzer:
         Returns:
             处理后的文章列表
         """
-        if not self.is_available():
+        if not self._available:
             logger.error("DeepSeek API不可用，跳过内容分析")
             return articles
         
-        processed_articles = []
-        
-        for i, article in enumerate(articles):
-            try:
-                logger.info(f"正在分析文章 {i+1}/{len(articles)}: {article.get('title', 'Unknown')}")
-                
-                # 文章总结
-                summary_result = self.summarize_article(article)
-                article['ai_summary'] = summary_result
-                
-                # 如果文章可能包含招聘信息，进行详细提取
-                if (article.get('is_job_related', False) or 
-                    article.get('has_job_images', False) or 
-                    '招聘' in article.get('title', '')):
-                    
-                    job_info_result = self.extract_job_info(article)
-                    article['job_extraction'] = job_info_result
-                    
-                    # 更新招聘相关标记
-                    if job_info_result.get('success') and job_info_result.get('job_info', {}).get('is_job_posting'):
-                        article['is_confirmed_job_posting'] = True
-                    else:
-                        article['is_confirmed_job_posting'] = False
-                else:
-                    article['is_confirmed_job_posting'] = False
-                
-                processed_articles.append(article)
-                
-                # 添加延迟，避免API请求过于频繁
-                time.sleep(1)
-                
-            except Exception as e:
-                logger.error(f"处理文章失败: {e}")
-                processed_articles.append(article)
-                continue
+        def process_all(unique_articles: List[Dict]) -> List[Dict]:
+            total = len(unique_articles)
+            
+            def process_one(item):
+                i, article = item
+                try:
+                    # 每32篇输出一次进度，单篇文章的标题只在DEBUG级别输出
+                    if i % 32 == 0:
+                        logger.info("分析进度 %d/%d", i + 1, total)
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("正在分析文章 %d/%d: %s", i + 1, total, article.get('title', 'Unknown'))
+                    return self.process_article(article)
+                except Exception as e:
+                    # 单篇文章失败（检查点读写、异常响应等）只影响当前文章，不能让异常
+                    # 从executor.map中抛出而丢失其余文章的结果
+                    logger.error("处理文章失败: %s", e)
+                    return article
+            
+            if not unique_articles:
+                return []
+            
+            # 多篇文章并发分析，请求频率由限流器控制；文章数少于并发数时不创建多余的线程
+            with ThreadPoolExecutor(max_workers=min(self.concurrency, total)) as executor:
+                return list(executor.map(process_one, enumerate(unique_articles)))
         
-        logger.info(f"文章分析完成，共处理 {len(processed_articles)} 篇文章")
-        return processed_articles
+        return self._process_unique(articles, process_all)
     
     def generate_summary_report(self, articles: List[Dict]) -> Dict:
         """
@@ -457,21 +1218,29 @@ class ContentAnalyzer:
         """
         try:
             total_articles = len(articles)
-            job_related_articles = len([a for a in articles if a.get('is_job_related', False)])
-            confirmed_job_postings = len([a for a in articles if a.get('is_confirmed_job_posting', False)])
-            articles_with_images = len([a for a in articles if a.get('has_job_images', False)])
+            job_related_articles = confirmed_job_postings = articles_with_images = 0
             
-            # 提取所有职位信息
+            # 单次遍历统计各类文章数量并提取所有职位信息
             all_positions = []
             for article in articles:
-                job_extraction = article.get('job_extraction', {})
-                if job_extraction.get('success') and job_extraction.get('job_info', {}).get('positions'):
-                    positions = job_extraction['job_info']['positions']
+                job_related_articles += bool(article.get('is_job_related', False))
+                confirmed_job_postings += bool(article.get('is_confirmed_job_posting', False))
+                articles_with_images += bool(article.get('has_job_images', False))
+                
+                job_extraction = article.get('job_extraction') or {}
+                if not job_extraction.get('success'):
+                    continue
+                
+                positions = (job_extraction.get('job_info') or {}).get('positions')
+                if positions:
+                    title = article.get('title', '')
+                    source = article.get('source', '')
+                    published = article.get('published', '')
                     for position in positions:
-                        position['article_title'] = article.get('title', '')
-                        position['source'] = article.get('source', '')
-                        position['published'] = article.get('published', '')
-                        all_positions.append(position)
+                        position['article_title'] = title
+                        position['source'] = source
+                        position['published'] = published
+                    all_positions.extend(positions)
             
             report = {
                 'generated_at': datetime.now().isoformat(),
@@ -486,11 +1255,11 @@ class ContentAnalyzer:
                 'articles': articles
             }
             
-            logger.info(f"生成总结报告: {total_articles} 篇文章, {confirmed_job_postings} 篇确认的招聘信息")
+            logger.info("生成总结报告: %d 篇文章, %d 篇确认的招聘信息", total_articles, confirmed_job_postings)
             return report
             
         except Exception as e:
-            logger.error(f"生成总结报告失败: {e}")
+            logger.error("生成总结报告失败: %s", e)
             return {
                 'generated_at': datetime.now().isoformat(),
                 'error': str(e),
@@ -524,4 +1293,5 @@ def test_content_analyzer():
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
     test_content_analyzer()
\ No newline at end of file
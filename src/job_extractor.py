@@ -5,18 +5,96 @@
 将分析后的招聘信息转换为结构化数据并生成表格
 """
 
-import json
+import functools
+import hashlib
+import importlib.util
 import logging
+import multiprocessing
 import os
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Optional, Any
-import pandas as pd
+from itertools import repeat
+from typing import TYPE_CHECKING, Dict, List, Optional, Any
+import orjson
 import re
 
+# pandas等依赖导入较慢，在实际生成表格时才导入
+if TYPE_CHECKING:
+    import pandas as pd
+
 # 配置日志
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# 可选依赖只检查是否安装，使用时再导入
+XLSXWRITER_AVAILABLE = importlib.util.find_spec('xlsxwriter') is not None
+
+# 预编译的正则表达式
+_WS_RE = re.compile(r'\s+')
+# 允许字符集包含全部\w，无法枚举成str.translate的删除表；按需缓存的转换表实测比单次正则替换更慢
+_DISALLOWED_RE = re.compile(r'[^\w\s\-\.@\(\)（），。、：；！？/]')
+# 电话号码：文本中任意位置有手机号时优先取第一个手机号（只保留11位号码，+86前缀不在分组内），
+# 没有手机号时才取第一个座机号。第一个分支从开头惰性扫描到手机号，失败后再逐位置匹配座机号
+_PHONE_RE = re.compile(r'^.*?(1[3-9]\d{9})|(0\d{2,3}-?\d{7,8})', re.DOTALL)
+# 薪资文本的各类记号，用一个带命名分组的正则单次扫描（千分位逗号视为数字的一部分）
+_SALARY_RE = re.compile(
+    r'(?P<num>\d{1,3}(?:,\d{3})+(?:\.\d+)?|\d+(?:\.\d+)?)'
+    r'|(?P<usd>\$|usd|dollar)'
+    r'|(?P<eur>€|eur|euro)'
+    r'|(?P<year>年|year|annual)'
+    r'|(?P<day>日|天|day|daily)'
+    r'|(?P<hour>时|hour)'
+    r'|(?P<above>以上|起|\+)'
+    r'|(?P<below>以下|内|-)',
+    re.IGNORECASE
+)
+# 薪资正则分组到货币/时间单位的映射，按优先级排列
+_CURRENCY_GROUPS = (('usd', 'USD'), ('eur', 'EUR'))
+_PERIOD_GROUPS = (('year', 'yearly'), ('day', 'daily'), ('hour', 'hourly'))
+# 邮箱：各部分长度有上限（本地部分64、域名每段63、最多8段），避免长串字母和点号上的二次方回溯
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]{1,64}@(?:[A-Za-z0-9-]{1,63}\.){1,8}[A-Za-z]{2,24}\b')
+
+# 报告表格的列顺序
+COLUMN_ORDER = [
+    'extraction_time', 'published_date', 'source', 'article_title',
+    'company_name', 'job_title', 'department', 'location', 'employment_type',
+    'salary_min', 'salary_max', 'salary_currency', 'salary_period', 'salary_original',
+    'requirements', 'responsibilities', 'benefits',
+    'contact_person', 'contact_phone', 'contact_email', 'contact_wechat',
+    'application_method', 'deadline', 'additional_info',
+    'company_address', 'article_url', 'has_image_text', 'ai_confidence'
+]
+
+# 需要提取的文章数达到该值时使用多进程并行提取，较少时进程启动开销得不偿失
+PARALLEL_MIN_ARTICLES = 100
+
+# 薪资数值列
+NUMERIC_COLUMNS = ('salary_min', 'salary_max')
+
+# 由extract_all_jobs按列统一清理的单值文本字段
+TEXT_COLUMNS = [
+    'company_name', 'job_title', 'department', 'location', 'employment_type',
+    'deadline', 'additional_info'
+]
+
+
+@functools.lru_cache(maxsize=4096)
+def _clean_text_cached(text: str) -> str:
+    """
+    清理文本内容（纯函数，按输入缓存结果；地点、部门等字段大量重复）
+    
+    Args:
+        text: 原始文本
+        
+    Returns:
+        清理后的文本
+    """
+    # 去除多余空格和换行
+    text = _WS_RE.sub(' ', text.strip())
+    
+    # 去除特殊字符
+    return _DISALLOWED_RE.sub('', text)
+
 
 class JobExtractor:
     """招聘信息提取器，负责结构化处理和表格生成"""
@@ -30,6 +108,9 @@ class JobExtractor:
         """
         self.output_dir = output_dir
         os.makedirs(output_dir, exist_ok=True)
+        
+        # 上次生成报告的输入摘要和结果，输入相同且报告文件仍在时直接复用
+        self.manifest_file = os.path.join(output_dir, "cache", "report_manifest.json")
     
     def clean_text(self, text: str) -> str:
         """
@@ -44,13 +125,23 @@ class JobExtractor:
         if not text or text == "未提及":
             return ""
         
-        # 去除多余空格和换行
-        text = re.sub(r'\s+', ' ', text.strip())
-        
-        # 去除特殊字符
-        text = re.sub(r'[^\w\s\-\.@\(\)（），。、：；！？/]', '', text)
+        return _clean_text_cached(text)
+    
+    def _join_clean(self, items) -> str:
+        """
+        清理列表中的每一项并用分号连接，忽略空项和"未提及"
         
-        return text
+        Args:
+            items: 文本列表或单个文本
+            
+        Returns:
+            连接后的文本
+        """
+        if not items:
+            return ''
+        if isinstance(items, str):
+            items = (items,)
+        return '; '.join(filter(None, (self.clean_text(item) for item in items if item and item != "未提及")))
     
     def extract_salary_range(self, salary_text: str) -> Dict:
         """
@@ -71,43 +162,35 @@ class JobExtractor:
                 'original_text': salary_text
             }
         
-        # 清理文本
-        clean_text = self.clean_text(salary_text)
-        
-        # 提取数字
-        numbers = re.findall(r'\d+(?:\.\d+)?', clean_text)
-        
-        # 判断货币单位
-        currency = 'CNY'
-        if any(unit in clean_text.lower() for unit in ['$', 'usd', 'dollar']):
-            currency = 'USD'
-        elif any(unit in clean_text.lower() for unit in ['€', 'eur', 'euro']):
-            currency = 'EUR'
-        
-        # 判断时间单位
-        period = 'monthly'
-        if any(unit in clean_text for unit in ['年', '年薪', 'year', 'annual']):
-            period = 'yearly'
-        elif any(unit in clean_text for unit in ['日', '天', 'day', 'daily']):
-            period = 'daily'
-        elif any(unit in clean_text for unit in ['时', '小时', 'hour', 'hourly']):
-            period = 'hourly'
+        # 单次扫描同时提取数字、货币单位、时间单位和上下限标记，只保留前两个数字
+        first = second = None
+        found = set()
+        for match in _SALARY_RE.finditer(salary_text):
+            kind = match.lastgroup
+            if kind != 'num':
+                found.add(kind)
+            elif first is None:
+                first = float(match.group(kind).replace(',', ''))
+            elif second is None:
+                second = float(match.group(kind).replace(',', ''))
+        
+        # 按优先级确定货币单位和时间单位
+        currency = next((value for group, value in _CURRENCY_GROUPS if group in found), 'CNY')
+        period = next((value for group, value in _PERIOD_GROUPS if group in found), 'monthly')
         
         # 提取薪资范围
         min_salary = None
         max_salary = None
         
-        if len(numbers) >= 2:
-            min_salary = float(numbers[0])
-            max_salary = float(numbers[1])
-        elif len(numbers) == 1:
+        if second is not None:
+            min_salary = first
+            max_salary = second
+        elif first is not None:
             # 如果只有一个数字，根据上下文判断
-            if any(word in clean_text for word in ['以上', '起', '+']):
-                min_salary = float(numbers[0])
-            elif any(word in clean_text for word in ['以下', '内', '-']):
-                max_salary = float(numbers[0])
+            if 'below' in found and 'above' not in found:
+                max_salary = first
             else:
-                min_salary = float(numbers[0])
+                min_salary = first
         
         return {
             'min_salary': min_salary,
@@ -131,24 +214,16 @@ class JobExtractor:
             return {}
         
         # 提取电话号码
-        phone_patterns = [
-            r'1[3-9]\d{9}',  # 中国手机号
-            r'0\d{2,3}-?\d{7,8}',  # 中国座机号
-            r'\+86\s?1[3-9]\d{9}'  # 带国家代码的手机号
-        ]
-        
         phone = contact_data.get('phone', '')
         if phone and phone != "未提及":
-            for pattern in phone_patterns:
-                match = re.search(pattern, phone)
-                if match:
-                    phone = match.group(0)
-                    break
+            match = _PHONE_RE.search(phone)
+            if match:
+                phone = match.group(1) or match.group(2)
         
         # 提取邮箱
         email = contact_data.get('email', '')
         if email and email != "未提及":
-            email_match = re.search(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', email)
+            email_match = _EMAIL_RE.search(email)
             if email_match:
                 email = email_match.group(0)
         
@@ -166,17 +241,20 @@ class JobExtractor:
             'application_method': self.clean_text(contact_data.get('application_method', ''))
         }
     
-    def extract_job_from_article(self, article: Dict) -> List[Dict]:
+    def extract_job_from_article(self, article: Dict, extraction_time: str = None) -> List[Dict]:
         """
         从文章中提取招聘信息
         
         Args:
             article: 文章数据
+            extraction_time: 提取时间（ISO格式），未提供时使用当前时间
             
         Returns:
             招聘信息列表
         """
         jobs = []
+        if extraction_time is None:
+            extraction_time = datetime.now().isoformat()
         
         try:
             # 获取AI提取的信息
@@ -188,11 +266,11 @@ class JobExtractor:
             if not job_info.get('is_job_posting'):
                 return jobs
             
-            # 基础信息
-            company_name = self.clean_text(job_info.get('company_name', ''))
+            # 基础信息（单值文本字段由extract_all_jobs按列统一清理）
+            company_name = job_info.get('company_name', '')
             contact_info = self.extract_contact_info(job_info.get('contact_info', {}))
-            deadline = self.clean_text(job_info.get('deadline', ''))
-            additional_info = self.clean_text(job_info.get('additional_info', ''))
+            deadline = job_info.get('deadline', '')
+            additional_info = job_info.get('additional_info', '')
             
             # 处理职位信息
             positions = job_info.get('positions', [])
@@ -204,21 +282,10 @@ class JobExtractor:
                 # 提取薪资信息
                 salary_info = self.extract_salary_range(position.get('salary', ''))
                 
-                # 处理要求和职责
-                requirements = position.get('requirements', [])
-                if isinstance(requirements, str):
-                    requirements = [requirements]
-                requirements_text = '; '.join([self.clean_text(req) for req in requirements if req and req != "未提及"])
-                
-                responsibilities = position.get('responsibilities', [])
-                if isinstance(responsibilities, str):
-                    responsibilities = [responsibilities]
-                responsibilities_text = '; '.join([self.clean_text(resp) for resp in responsibilities if resp and resp != "未提及"])
-                
-                benefits = position.get('benefits', [])
-                if isinstance(benefits, str):
-                    benefits = [benefits]
-                benefits_text = '; '.join([self.clean_text(ben) for ben in benefits if ben and ben != "未提及"])
+                # 处理要求、职责和福利
+                requirements_text = self._join_clean(position.get('requirements', []))
+                responsibilities_text = self._join_clean(position.get('responsibilities', []))
+                benefits_text = self._join_clean(position.get('benefits', []))
                 
                 # 创建职位记录
                 job_record = {
@@ -227,17 +294,17 @@ class JobExtractor:
                     'source': article.get('source', ''),
                     'published_date': article.get('published', ''),
                     'article_url': article.get('link', ''),
-                    'extraction_time': datetime.now().isoformat(),
+                    'extraction_time': extraction_time,
                     
                     # 公司信息
                     'company_name': company_name,
                     'company_address': contact_info.get('address', ''),
                     
                     # 职位信息
-                    'job_title': self.clean_text(position.get('job_title', '')),
-                    'department': self.clean_text(position.get('department', '')),
-                    'location': self.clean_text(position.get('location', '')),
-                    'employment_type': self.clean_text(position.get('employment_type', '')),
+                    'job_title': position.get('job_title', ''),
+                    'department': position.get('department', ''),
+                    'location': position.get('location', ''),
+                    'employment_type': position.get('employment_type', ''),
                     
                     # 薪资信息
                     'salary_min': salary_info.get('min_salary'),
@@ -265,7 +332,7 @@ class JobExtractor:
                     # 标记信息
                     'is_confirmed': True,
                     'has_image_text': article.get('has_job_images', False),
-                    'ai_confidence': job_extraction.get('usage', {}).get('total_tokens', 0) > 0
+                    'ai_confidence': bool(job_extraction.get('raw_response'))
                 }
                 
                 jobs.append(job_record)
@@ -286,19 +353,69 @@ class JobExtractor:
             所有招聘信息列表
         """
         all_jobs = []
+        # 同一批次的招聘信息共用一个提取时间
+        extraction_time = datetime.now().isoformat()
+        
+        # 先筛出AI确认为招聘信息的文章，大部分非招聘文章无需进入提取流程
+        job_articles = [
+            article for article in articles
+            if (article.get('job_extraction') or {}).get('success')
+            and ((article['job_extraction'].get('job_info') or {}).get('is_job_posting'))
+        ]
         
-        for article in articles:
-            try:
-                jobs = self.extract_job_from_article(article)
-                all_jobs.extend(jobs)
-            except Exception as e:
-                logger.error(f"处理文章失败: {e}")
-                continue
+        if len(job_articles) >= PARALLEL_MIN_ARTICLES:
+            # 文章较多时多进程并行提取（正则清理等均为CPU密集操作），每个进程分到若干批。
+            # 子进程用spawn启动：主程序此时已有分析线程、连接池和日志缓冲，fork会把其他线程
+            # 持有中的锁一起复制到子进程，可能导致死锁
+            workers = os.cpu_count() or 1
+            chunksize = max(1, len(job_articles) // (4 * workers))
+            with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn')) as executor:
+                for jobs in executor.map(
+                    self.extract_job_from_article,
+                    job_articles,
+                    repeat(extraction_time),
+                    chunksize=chunksize
+                ):
+                    all_jobs.extend(jobs)
+        else:
+            for article in job_articles:
+                try:
+                    jobs = self.extract_job_from_article(article, extraction_time)
+                    all_jobs.extend(jobs)
+                except Exception as e:
+                    logger.error(f"处理文章失败: {e}")
+                    continue
+        
+        self._clean_text_columns(all_jobs)
         
         logger.info(f"共提取到 {len(all_jobs)} 个招聘信息")
         return all_jobs
     
-    def create_job_dataframe(self, jobs: List[Dict]) -> pd.DataFrame:
+    @staticmethod
+    def _clean_text_columns(jobs: List[Dict]):
+        """
+        按列批量清理招聘信息中的单值文本字段，规则与clean_text相同
+        
+        Args:
+            jobs: 招聘信息列表，原地修改
+        """
+        if not jobs:
+            return
+        
+        import pandas as pd
+        
+        for col in TEXT_COLUMNS:
+            values = pd.Series([job.get(col) for job in jobs], dtype=object).fillna('').astype(str)
+            values = (
+                values.mask(values.eq('未提及'), '')
+                .str.strip()
+                .str.replace(_WS_RE, ' ', regex=True)
+                .str.replace(_DISALLOWED_RE, '', regex=True)
+            )
+            for job, value in zip(jobs, values.tolist()):
+                job[col] = value
+    
+    def create_job_dataframe(self, jobs: List[Dict]) -> 'pd.DataFrame':
         """
         创建招聘信息DataFrame
         
@@ -308,49 +425,39 @@ class JobExtractor:
         Returns:
             DataFrame
         """
+        import pandas as pd
+        
         if not jobs:
             return pd.DataFrame()
         
-        # 创建DataFrame
-        df = pd.DataFrame(jobs)
-        
-        # 重新排列列顺序
-        column_order = [
-            'extraction_time', 'published_date', 'source', 'article_title',
-            'company_name', 'job_title', 'department', 'location', 'employment_type',
-            'salary_min', 'salary_max', 'salary_currency', 'salary_period', 'salary_original',
-            'requirements', 'responsibilities', 'benefits',
-            'contact_person', 'contact_phone', 'contact_email', 'contact_wechat',
-            'application_method', 'deadline', 'additional_info',
-            'company_address', 'article_url', 'has_image_text', 'ai_confidence'
-        ]
-        
-        # 确保所有列都存在
-        for col in column_order:
-            if col not in df.columns:
-                df[col] = ''
-        
-        df = df[column_order]
-        
-        # 数据类型转换
-        numeric_columns = ['salary_min', 'salary_max']
-        for col in numeric_columns:
-            df[col] = pd.to_numeric(df[col], errors='coerce')
-        
-        # 日期格式化
+        # 按列组装数据直接构建DataFrame，列顺序固定，缺失的字段填充空字符串；
+        # 薪资已由extract_salary_range转换为float或None，构建时直接指定为浮点列
+        df = pd.DataFrame({
+            col: (
+                pd.Series([job.get(col) for job in jobs], dtype='float64')
+                if col in NUMERIC_COLUMNS else
+                [job.get(col, '') for job in jobs]
+            )
+            for col in COLUMN_ORDER
+        })
+        
+        # 日期格式化：两列都是isoformat()生成的ISO 8601字符串，指定格式可跳过逐行推断；
+        # 带时区和不带时区的值统一按UTC解析后去掉时区（Excel不支持带时区的时间）
         date_columns = ['extraction_time', 'published_date']
         for col in date_columns:
-            df[col] = pd.to_datetime(df[col], errors='coerce')
+            df[col] = pd.to_datetime(df[col], format='ISO8601', errors='coerce', utc=True).dt.tz_localize(None)
         
         return df
     
-    def generate_excel_report(self, jobs: List[Dict], filename: str = None) -> str:
+    def generate_excel_report(self, jobs: List[Dict], filename: str = None,
+                            df: Optional['pd.DataFrame'] = None) -> str:
         """
         生成Excel报告
         
         Args:
             jobs: 招聘信息列表
             filename: 文件名
+            df: 已由create_job_dataframe构建的DataFrame，提供时不再重复构建
             
         Returns:
             文件路径
@@ -362,48 +469,55 @@ class JobExtractor:
         filepath = os.path.join(self.output_dir, filename)
         
         try:
+            import pandas as pd
+            
             # 创建DataFrame
-            df = self.create_job_dataframe(jobs)
+            if df is None:
+                df = self.create_job_dataframe(jobs)
             
             if df.empty:
                 logger.warning("没有招聘信息可导出")
                 return ""
             
-            # 创建Excel写入器
-            with pd.ExcelWriter(filepath, engine='openpyxl') as writer:
-                # 主表：招聘信息
-                df.to_excel(writer, sheet_name='招聘信息', index=False)
+            # 创建Excel写入器：优先使用更快的xlsxwriter，未安装时使用openpyxl。
+            # 不能开启xlsxwriter的constant_memory模式：pandas按列写入单元格，该模式下已写过的行会被提前落盘，数据会丢失
+            if XLSXWRITER_AVAILABLE:
+                writer = pd.ExcelWriter(filepath, engine='xlsxwriter')
+            else:
+                writer = pd.ExcelWriter(filepath, engine='openpyxl')
+            
+            with writer:
+                # 公司汇总：数值列走pandas内置聚合，只有工作地点需要逐组拼接字符串；不对分组键排序
+                by_company = df.groupby('company_name', sort=False)
+                company_stats = by_company.agg(
+                    职位数=('job_title', 'count'),
+                    平均最低薪资=('salary_min', 'mean'),
+                    平均最高薪资=('salary_max', 'mean')
+                ).round(2)
+                company_stats.insert(1, '工作地点', by_company['location'].agg(lambda x: ', '.join(pd.unique(x))))
+                
+                # 职位分类
+                job_stats = df.groupby('job_title', sort=False).agg(
+                    公司数=('company_name', 'count'),
+                    平均最低薪资=('salary_min', 'mean'),
+                    平均最高薪资=('salary_max', 'mean')
+                ).round(2)
                 
-                # 统计表
-                stats_data = {
+                # 统计表：公司数量直接取公司汇总的分组数；有电话或邮箱的职位只计一次
+                has_contact = df['contact_phone'].ne('') | df['contact_email'].ne('')
+                stats_df = pd.DataFrame({
                     '统计项': ['总职位数', '公司数量', '有薪资信息的职位', '有联系方式的职位'],
                     '数量': [
                         len(df),
-                        df['company_name'].nunique(),
-                        df['salary_min'].notna().sum(),
-                        (df['contact_phone'] != '').sum() + (df['contact_email'] != '').sum()
+                        len(company_stats),
+                        int(df['salary_min'].notna().sum()),
+                        int(has_contact.sum())
                     ]
-                }
-                stats_df = pd.DataFrame(stats_data)
-                stats_df.to_excel(writer, sheet_name='统计信息', index=False)
+                })
                 
-                # 公司汇总
-                company_stats = df.groupby('company_name').agg({
-                    'job_title': 'count',
-                    'location': lambda x: ', '.join(x.unique()),
-                    'salary_min': 'mean',
-                    'salary_max': 'mean'
-                }).round(2)
-                company_stats.columns = ['职位数', '工作地点', '平均最低薪资', '平均最高薪资']
+                df.to_excel(writer, sheet_name='招聘信息', index=False)
+                stats_df.to_excel(writer, sheet_name='统计信息', index=False)
                 company_stats.to_excel(writer, sheet_name='公司汇总')
-                
-                # 职位分类
-                job_stats = df.groupby('job_title').agg({
-                    'company_name': 'count',
-                    'salary_min': 'mean',
-                    'salary_max': 'mean'
-                }).round(2)
-                job_stats.columns = ['公司数', '平均最低薪资', '平均最高薪资']
                 job_stats.to_excel(writer, sheet_name='职位分类')
             
             logger.info(f"Excel报告已生成: {filepath}")
@@ -413,13 +527,15 @@ class JobExtractor:
             logger.error(f"生成Excel报告失败: {e}")
             return ""
     
-    def generate_csv_report(self, jobs: List[Dict], filename: str = None) -> str:
+    def generate_csv_report(self, jobs: List[Dict], filename: str = None,
+                            df: Optional['pd.DataFrame'] = None) -> str:
         """
         生成CSV报告
         
         Args:
             jobs: 招聘信息列表
             filename: 文件名
+            df: 已由create_job_dataframe构建的DataFrame，提供时不再重复构建
             
         Returns:
             文件路径
@@ -431,7 +547,8 @@ class JobExtractor:
         filepath = os.path.join(self.output_dir, filename)
         
         try:
-            df = self.create_job_dataframe(jobs)
+            if df is None:
+                df = self.create_job_dataframe(jobs)
             
             if df.empty:
                 logger.warning("没有招聘信息可导出")
@@ -469,8 +586,8 @@ class JobExtractor:
                 'jobs': jobs
             }
             
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(report_data, f, ensure_ascii=False, indent=2)
+            with open(filepath, 'wb') as f:
+                f.write(orjson.dumps(report_data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
             
             logger.info(f"JSON报告已生成: {filepath}")
             return filepath
@@ -479,19 +596,91 @@ class JobExtractor:
             logger.error(f"生成JSON报告失败: {e}")
             return ""
     
-    def process_articles_and_generate_reports(self, articles: List[Dict]) -> Dict:
+    @staticmethod
+    def _report_input_key(articles: List[Dict]) -> str:
+        """
+        计算报告输入的摘要，只包含提取招聘信息时用到的字段
+        
+        Args:
+            articles: 文章列表
+            
+        Returns:
+            输入摘要
+        """
+        fields = [
+            (
+                article.get('title', ''),
+                article.get('source', ''),
+                article.get('published', ''),
+                article.get('link', ''),
+                article.get('has_job_images', False),
+                article.get('job_extraction', {}).get('success'),
+                article.get('job_extraction', {}).get('job_info'),
+                bool(article.get('job_extraction', {}).get('raw_response'))
+            )
+            for article in articles
+        ]
+        data = orjson.dumps(fields, option=orjson.OPT_SORT_KEYS | orjson.OPT_SERIALIZE_NUMPY, default=str)
+        return hashlib.sha256(data).hexdigest()
+    
+    def _load_manifest(self, input_key: str) -> Optional[Dict]:
+        """
+        读取上次生成报告的结果
+        
+        Args:
+            input_key: 本次输入的摘要
+            
+        Returns:
+            输入相同且报告文件都存在时返回上次的结果，否则返回None
+        """
+        try:
+            with open(self.manifest_file, 'rb') as f:
+                manifest = orjson.loads(f.read())
+        except (OSError, orjson.JSONDecodeError):
+            return None
+        
+        result = manifest.get('result') if manifest.get('input_key') == input_key else None
+        if not result or not all(os.path.exists(path) for path in result.get('files', {}).values()):
+            return None
+        return result
+    
+    def _save_manifest(self, input_key: str, result: Dict):
+        """
+        记录本次生成报告的输入摘要和结果
+        
+        Args:
+            input_key: 本次输入的摘要
+            result: 生成结果
+        """
+        try:
+            os.makedirs(os.path.dirname(self.manifest_file), exist_ok=True)
+            with open(self.manifest_file, 'wb') as f:
+                f.write(orjson.dumps({'input_key': input_key, 'result': result}))
+        except OSError as e:
+            logger.warning(f"保存报告记录失败: {e}")
+    
+    def process_articles_and_generate_reports(self, articles: List[Dict], jobs: Optional[List[Dict]] = None) -> Dict:
         """
         处理文章并生成所有格式的报告
         
         Args:
             articles: 文章列表
+            jobs: 已从articles提取的招聘信息，未提供时在需要生成报告时提取
             
         Returns:
-            生成的报告文件路径
+            生成结果，其中files只包含已成功写入的报告文件路径
         """
         try:
+            # 输入与上次相同且报告文件都还在时，不再重新生成
+            input_key = self._report_input_key(articles)
+            cached = self._load_manifest(input_key)
+            if cached is not None:
+                logger.info("招聘信息与上次相同，复用已生成的报告")
+                return cached
+            
             # 提取招聘信息
-            jobs = self.extract_all_jobs(articles)
+            if jobs is None:
+                jobs = self.extract_all_jobs(articles)
             
             if not jobs:
                 logger.warning("没有找到招聘信息")
@@ -506,13 +695,16 @@ class JobExtractor:
             
             files = {}
             
+            # Excel和CSV报告共用同一个DataFrame
+            df = self.create_job_dataframe(jobs)
+            
             # Excel报告
-            excel_file = self.generate_excel_report(jobs, f"招聘信息汇总_{timestamp}.xlsx")
+            excel_file = self.generate_excel_report(jobs, f"招聘信息汇总_{timestamp}.xlsx", df=df)
             if excel_file:
                 files['excel'] = excel_file
             
             # CSV报告
-            csv_file = self.generate_csv_report(jobs, f"招聘信息_{timestamp}.csv")
+            csv_file = self.generate_csv_report(jobs, f"招聘信息_{timestamp}.csv", df=df)
             if csv_file:
                 files['csv'] = csv_file
             
@@ -521,12 +713,14 @@ class JobExtractor:
             if json_file:
                 files['json'] = json_file
             
-            return {
+            result = {
                 'success': True,
                 'message': f'成功生成 {len(jobs)} 个招聘信息的报告',
                 'job_count': len(jobs),
                 'files': files
             }
+            self._save_manifest(input_key, result)
+            return result
             
         except Exception as e:
             logger.error(f"处理文章和生成报告失败: {e}")
@@ -5,17 +5,24 @@
 支持邮件和企业微信等多种通知方式
 """
 
+import atexit
+import base64
+import functools
 import smtplib
 import logging
 import os
+import weakref
 import requests
-import json
+import orjson
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, List, Optional
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from email.mime.base import MIMEBase
-from email import encoders
+from email.policy import SMTP as SMTP_POLICY
 from email.utils import formataddr
 
 # 配置日志
@@ -23,67 +30,30 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
-class NotificationSender:
-    """通知发送器，支持多种通知方式"""
-    
-    def __init__(self):
-        """初始化通知发送器"""
-        self.email_config = self._load_email_config()
-        self.wechat_config = self._load_wechat_config()
-    
-    def _load_email_config(self) -> Dict:
-        """加载邮件配置"""
-        return {
-            'smtp_server': os.getenv('SMTP_SERVER', ''),
-            'smtp_port': int(os.getenv('SMTP_PORT', '587')),
-            'sender_email': os.getenv('SENDER_EMAIL', ''),
-            'sender_password': os.getenv('SENDER_PASSWORD', ''),
-            'sender_name': os.getenv('SENDER_NAME', '招聘信息监控系统'),
-            'receiver_emails': os.getenv('RECEIVER_EMAILS', '').split(',') if os.getenv('RECEIVER_EMAILS') else []
-        }
-    
-    def _load_wechat_config(self) -> Dict:
-        """加载企业微信配置"""
-        return {
-            'webhook_url': os.getenv('WECHAT_WEBHOOK_URL', ''),
-            'mentioned_list': os.getenv('WECHAT_MENTIONED_LIST', '').split(',') if os.getenv('WECHAT_MENTIONED_LIST') else []
-        }
-    
-    def generate_email_content(self, summary: Dict, jobs: List[Dict]) -> tuple:
-        """
-        生成邮件内容
-        
-        Args:
-            summary: 汇总信息
-            jobs: 招聘信息列表
-            
-        Returns:
-            (subject, text_content, html_content)
-        """
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        job_count = len(jobs)
-        
-        # 邮件主题
-        if job_count > 0:
-            subject = f"🎬 发现 {job_count} 个新的影视招聘信息 - {timestamp}"
-        else:
-            subject = f"📄 招聘信息监控报告 - {timestamp}"
-        
-        # 文本内容
-        text_content = f"""
+# 邮件模板在模块导入时构建一次，生成邮件时只做字段替换
+_EMAIL_TEXT_HEADER = """
 招聘信息监控报告
 生成时间: {timestamp}
 
 📊 统计信息:
-- 总文章数: {summary.get('statistics', {}).get('total_articles', 0)}
-- 招聘相关文章: {summary.get('statistics', {}).get('job_related_articles', 0)}
-- 确认的招聘信息: {summary.get('statistics', {}).get('confirmed_job_postings', 0)}
+- 总文章数: {total_articles}
+- 招聘相关文章: {job_related_articles}
+- 确认的招聘信息: {confirmed_job_postings}
 - 提取的职位数: {job_count}
 
 """
-        
-        # HTML内容
-        html_content = f"""
+
+_EMAIL_TEXT_JOB = """
+{index}. {job_title}
+公司: {company_name}
+地点: {location}
+薪资: {salary_text}
+联系方式: {contact_text}
+来源: {source}
+---
+"""
+
+_EMAIL_HTML_HEADER = """
 <!DOCTYPE html>
 <html>
 <head>
@@ -111,70 +81,44 @@ class NotificationSender:
     <div class="stats">
         <h2>📊 统计信息</h2>
         <ul>
-            <li>总文章数: {summary.get('statistics', {}).get('total_articles', 0)}</li>
-            <li>招聘相关文章: {summary.get('statistics', {}).get('job_related_articles', 0)}</li>
-            <li>确认的招聘信息: {summary.get('statistics', {}).get('confirmed_job_postings', 0)}</li>
+            <li>总文章数: {total_articles}</li>
+            <li>招聘相关文章: {job_related_articles}</li>
+            <li>确认的招聘信息: {confirmed_job_postings}</li>
             <li>提取的职位数: {job_count}</li>
         </ul>
     </div>
 """
-        
-        if jobs:
-            html_content += "<h2>🔍 招聘信息详情</h2>"
-            
-            for i, job in enumerate(jobs, 1):
-                salary_text = ""
-                if job.get('salary_min') and job.get('salary_max'):
-                    salary_text = f"{job['salary_min']}-{job['salary_max']} {job.get('salary_currency', 'CNY')}/{job.get('salary_period', 'month')}"
-                elif job.get('salary_original'):
-                    salary_text = job['salary_original']
-                
-                contact_parts = []
-                if job.get('contact_person'):
-                    contact_parts.append(f"联系人: {job['contact_person']}")
-                if job.get('contact_phone'):
-                    contact_parts.append(f"电话: {job['contact_phone']}")
-                if job.get('contact_email'):
-                    contact_parts.append(f"邮箱: {job['contact_email']}")
-                if job.get('contact_wechat'):
-                    contact_parts.append(f"微信: {job['contact_wechat']}")
-                
-                contact_text = " | ".join(contact_parts) if contact_parts else "暂无联系方式"
-                
-                html_content += f"""
+
+_EMAIL_HTML_JOB = """
                 <div class="job-item">
-                    <div class="job-title">{i}. {job.get('job_title', '未知职位')}</div>
-                    <div class="company">🏢 {job.get('company_name', '未知公司')}</div>
-                    <div class="location">📍 {job.get('location', '未知地点')}</div>
-                    {f'<div class="salary">💰 {salary_text}</div>' if salary_text else ''}
+                    <div class="job-title">{index}. {job_title}</div>
+                    <div class="company">🏢 {company_name}</div>
+                    <div class="location">📍 {location}</div>
+                    {salary_html}
                     
-                    {f'<p><strong>任职要求:</strong> {job.get("requirements", "")}</p>' if job.get("requirements") else ''}
-                    {f'<p><strong>工作职责:</strong> {job.get("responsibilities", "")}</p>' if job.get("responsibilities") else ''}
-                    {f'<p><strong>福利待遇:</strong> {job.get("benefits", "")}</p>' if job.get("benefits") else ''}
+                    {requirements_html}
+                    {responsibilities_html}
+                    {benefits_html}
                     
                     <div class="contact">
                         <strong>联系方式:</strong> {contact_text}
                     </div>
                     
-                    <p><small>来源: {job.get('source', '')} | 发布时间: {job.get('published_date', '')}</small></p>
+                    <p><small>来源: {source} | 发布时间: {published_date}</small></p>
                 </div>
                 """
-                
-                # 添加到文本内容
-                text_content += f"""
-{i}. {job.get('job_title', '未知职位')}
-公司: {job.get('company_name', '未知公司')}
-地点: {job.get('location', '未知地点')}
-薪资: {salary_text}
-联系方式: {contact_text}
-来源: {job.get('source', '')}
----
-"""
-        else:
-            html_content += "<p>本次监控未发现新的招聘信息。</p>"
-            text_content += "\n本次监控未发现新的招聘信息。\n"
-        
-        html_content += """
+
+_EMAIL_HTML_SALARY = '<div class="salary">💰 {}</div>'
+
+_EMAIL_HTML_PARAGRAPH = '<p><strong>{}:</strong> {}</p>'
+
+# 最多缓存的已生成邮件内容数量
+EMAIL_CONTENT_CACHE_SIZE = 64
+
+# 附件分块编码的块大小，base64每行76个字符对应57字节，按整行分块保证各块编码结果可以直接拼接
+_ATTACHMENT_CHUNK_SIZE = 57 * 864
+
+_EMAIL_HTML_FOOTER = """
     <div class="footer">
         <p>此邮件由招聘信息监控系统自动生成</p>
         <p>如有疑问，请联系管理员</p>
@@ -182,10 +126,234 @@ class NotificationSender:
 </body>
 </html>
 """
+
+
+def _now() -> str:
+    """当前时间，用于通知中的报告时间"""
+    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+
+def _format_salary(job: Dict) -> str:
+    """格式化薪资文本，有薪资范围时附带币种和周期"""
+    if job.get('salary_min') and job.get('salary_max'):
+        return f"{job['salary_min']}-{job['salary_max']} {job.get('salary_currency', 'CNY')}/{job.get('salary_period', 'month')}"
+    return job.get('salary_original') or ""
+
+
+def _format_salary_brief(job: Dict) -> str:
+    """格式化简短的薪资文本，用于消息摘要"""
+    if job.get('salary_min') and job.get('salary_max'):
+        return f"{job['salary_min']}-{job['salary_max']}"
+    return job.get('salary_original') or ""
+
+
+def _format_contact(job: Dict) -> str:
+    """合并各项联系方式"""
+    contact_parts = []
+    if job.get('contact_person'):
+        contact_parts.append(f"联系人: {job['contact_person']}")
+    if job.get('contact_phone'):
+        contact_parts.append(f"电话: {job['contact_phone']}")
+    if job.get('contact_email'):
+        contact_parts.append(f"邮箱: {job['contact_email']}")
+    if job.get('contact_wechat'):
+        contact_parts.append(f"微信: {job['contact_wechat']}")
+    
+    return " | ".join(contact_parts) if contact_parts else "暂无联系方式"
+
+
+def _prerender_jobs(jobs: List[Dict]) -> List[Dict]:
+    """
+    为招聘信息预先生成展示文本，已生成过的条目原样返回
+    
+    Args:
+        jobs: 招聘信息列表
         
-        return subject, text_content, html_content
+    Returns:
+        附带salary_text、salary_brief、contact_text字段的招聘信息列表
+    """
+    return [
+        job if 'contact_text' in job else {
+            **job,
+            'salary_text': _format_salary(job),
+            'salary_brief': _format_salary_brief(job),
+            'contact_text': _format_contact(job),
+        }
+        for job in jobs
+    ]
+
+
+def _build_attachment(file_path: str) -> MIMEBase:
+    """
+    构建邮件附件，分块读取并进行base64编码，不需要一次性把整个文件读入内存
     
-    def send_email(self, summary: Dict, jobs: List[Dict], attachments: List[str] = None) -> bool:
+    Args:
+        file_path: 附件文件路径
+        
+    Returns:
+        附件对象
+    """
+    encoded_chunks = []
+    with open(file_path, 'rb') as attachment:
+        for chunk in iter(functools.partial(attachment.read, _ATTACHMENT_CHUNK_SIZE), b''):
+            encoded_chunks.append(base64.encodebytes(chunk))
+    
+    part = MIMEBase('application', 'octet-stream', policy=SMTP_POLICY)
+    part.set_payload(b''.join(encoded_chunks).decode('ascii'))
+    part['Content-Transfer-Encoding'] = 'base64'
+    # 通过参数形式传入文件名，非ASCII文件名会按RFC 2231编码
+    part.add_header('Content-Disposition', 'attachment', filename=os.path.basename(file_path))
+    return part
+
+
+# 通知配置在进程内只从环境变量读取一次（结果会被缓存，修改环境变量后需调用对应函数的 cache_clear()）
+@functools.lru_cache(maxsize=None)
+def _load_email_config() -> Dict:
+    """加载邮件配置"""
+    receiver_emails = os.getenv('RECEIVER_EMAILS', '')
+    return {
+        'smtp_server': os.getenv('SMTP_SERVER', ''),
+        'smtp_port': int(os.getenv('SMTP_PORT', '587')),
+        'sender_email': os.getenv('SENDER_EMAIL', ''),
+        'sender_password': os.getenv('SENDER_PASSWORD', ''),
+        'sender_name': os.getenv('SENDER_NAME', '招聘信息监控系统'),
+        'receiver_emails': receiver_emails.split(',') if receiver_emails else []
+    }
+
+
+@functools.lru_cache(maxsize=None)
+def _load_wechat_config() -> Dict:
+    """加载企业微信配置"""
+    mentioned_list = os.getenv('WECHAT_MENTIONED_LIST', '')
+    return {
+        'webhook_url': os.getenv('WECHAT_WEBHOOK_URL', ''),
+        'mentioned_list': mentioned_list.split(',') if mentioned_list else []
+    }
+
+
+@functools.lru_cache(maxsize=None)
+def _load_server_chan_key() -> str:
+    """加载Server酱配置"""
+    return os.getenv('SERVER_CHAN_KEY', '')
+
+
+# 尚未回收的通知发送器，进程退出时统一关闭其连接；弱引用不会让发送器一直存活到进程退出
+_LIVE_SENDERS = weakref.WeakSet()
+
+
+@atexit.register
+def _close_live_senders():
+    """进程退出时关闭所有尚未回收的通知发送器"""
+    for sender in list(_LIVE_SENDERS):
+        sender.close()
+
+
+class NotificationSender:
+    """通知发送器，支持多种通知方式"""
+    
+    def __init__(self):
+        """初始化通知发送器"""
+        self.email_config = _load_email_config()
+        self.wechat_config = _load_wechat_config()
+        self.server_chan_key = _load_server_chan_key()
+        # 复用的SMTP连接，首次发送时建立，进程退出时关闭
+        self._smtp: Optional[smtplib.SMTP] = None
+        # 已生成的邮件内容，键为汇总信息、招聘信息和报告时间的序列化结果
+        self._email_content_cache: Dict[bytes, tuple] = {}
+        # 复用连接的HTTP会话，多次推送Webhook时不必重新建立TCP/TLS连接；连接失败时短暂退避重试
+        self._http = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=8,
+            pool_maxsize=8,
+            max_retries=Retry(total=2, backoff_factor=0.2)
+        )
+        self._http.mount("https://", adapter)
+        self._http.mount("http://", adapter)
+        _LIVE_SENDERS.add(self)
+    
+    def generate_email_content(self, summary: Dict, jobs: List[Dict], timestamp: Optional[str] = None) -> tuple:
+        """
+        生成邮件内容
+        
+        Args:
+            summary: 汇总信息
+            jobs: 招聘信息列表
+            timestamp: 报告时间，默认取当前时间
+            
+        Returns:
+            (subject, text_content, html_content)
+        """
+        timestamp = timestamp or _now()
+        jobs = _prerender_jobs(jobs)
+        
+        # 相同内容的邮件（如重试发送）直接复用上次生成的结果
+        cache_key = orjson.dumps([summary, jobs, timestamp], option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS, default=str)
+        cached = self._email_content_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        job_count = len(jobs)
+        
+        # 邮件主题
+        if job_count > 0:
+            subject = f"🎬 发现 {job_count} 个新的影视招聘信息 - {timestamp}"
+        else:
+            subject = f"📄 招聘信息监控报告 - {timestamp}"
+        
+        stats = summary.get('statistics', {})
+        header_fields = {
+            'timestamp': timestamp,
+            'total_articles': stats.get('total_articles', 0),
+            'job_related_articles': stats.get('job_related_articles', 0),
+            'confirmed_job_postings': stats.get('confirmed_job_postings', 0),
+            'job_count': job_count,
+        }
+        
+        # 文本和HTML内容都先收集片段，最后一次性拼接
+        text_parts = [_EMAIL_TEXT_HEADER.format_map(header_fields)]
+        html_parts = [_EMAIL_HTML_HEADER.format_map(header_fields)]
+        
+        if jobs:
+            html_parts.append("<h2>🔍 招聘信息详情</h2>")
+            
+            for i, job in enumerate(jobs, 1):
+                salary_text = job['salary_text']
+                job_fields = {
+                    'index': i,
+                    'job_title': job.get('job_title', '未知职位'),
+                    'company_name': job.get('company_name', '未知公司'),
+                    'location': job.get('location', '未知地点'),
+                    'salary_text': salary_text,
+                    'contact_text': job['contact_text'],
+                    'source': job.get('source', ''),
+                    'published_date': job.get('published_date', ''),
+                }
+                
+                # 添加到文本内容
+                text_parts.append(_EMAIL_TEXT_JOB.format_map(job_fields))
+                
+                # HTML模板所需的可选段落直接加入同一个字段字典，不再为每个职位合并出新的关键字参数字典
+                job_fields['salary_html'] = _EMAIL_HTML_SALARY.format(salary_text) if salary_text else ''
+                job_fields['requirements_html'] = _EMAIL_HTML_PARAGRAPH.format('任职要求', job['requirements']) if job.get('requirements') else ''
+                job_fields['responsibilities_html'] = _EMAIL_HTML_PARAGRAPH.format('工作职责', job['responsibilities']) if job.get('responsibilities') else ''
+                job_fields['benefits_html'] = _EMAIL_HTML_PARAGRAPH.format('福利待遇', job['benefits']) if job.get('benefits') else ''
+                html_parts.append(_EMAIL_HTML_JOB.format_map(job_fields))
+        else:
+            html_parts.append("<p>本次监控未发现新的招聘信息。</p>")
+            text_parts.append("\n本次监控未发现新的招聘信息。\n")
+        
+        html_parts.append(_EMAIL_HTML_FOOTER)
+        text_content = "".join(text_parts)
+        html_content = "".join(html_parts)
+        
+        result = (subject, text_content, html_content)
+        if len(self._email_content_cache) >= EMAIL_CONTENT_CACHE_SIZE:
+            self._email_content_cache.pop(next(iter(self._email_content_cache)), None)
+        self._email_content_cache[cache_key] = result
+        return result
+    
+    def send_email(self, summary: Dict, jobs: List[Dict], attachments: List[str] = None,
+                   timestamp: Optional[str] = None) -> bool:
         """
         发送邮件通知
         
@@ -193,6 +361,7 @@ class NotificationSender:
             summary: 汇总信息
             jobs: 招聘信息列表
             attachments: 附件文件路径列表
+            timestamp: 报告时间，默认取当前时间
             
         Returns:
             发送是否成功
@@ -203,40 +372,30 @@ class NotificationSender:
         
         try:
             # 生成邮件内容
-            subject, text_content, html_content = self.generate_email_content(summary, jobs)
+            subject, text_content, html_content = self.generate_email_content(summary, jobs, timestamp)
             
-            # 创建邮件
-            msg = MIMEMultipart('alternative')
+            # 创建邮件，使用SMTP策略（CRLF换行），send_message序列化时无需再转换换行符
+            msg = MIMEMultipart('alternative', policy=SMTP_POLICY)
             msg['Subject'] = subject
             msg['From'] = formataddr((self.email_config['sender_name'], self.email_config['sender_email']))
             msg['To'] = ', '.join(self.email_config['receiver_emails'])
             
             # 添加文本和HTML内容
-            msg.attach(MIMEText(text_content, 'plain', 'utf-8'))
-            msg.attach(MIMEText(html_content, 'html', 'utf-8'))
+            msg.attach(MIMEText(text_content, 'plain', 'utf-8', policy=SMTP_POLICY))
+            msg.attach(MIMEText(html_content, 'html', 'utf-8', policy=SMTP_POLICY))
             
             # 添加附件
             if attachments:
                 for file_path in attachments:
                     if os.path.exists(file_path):
-                        with open(file_path, 'rb') as attachment:
-                            part = MIMEBase('application', 'octet-stream')
-                            part.set_payload(attachment.read())
-                            encoders.encode_base64(part)
-                            part.add_header(
-                                'Content-Disposition',
-                                f'attachment; filename= {os.path.basename(file_path)}'
-                            )
-                            msg.attach(part)
-            
-            # 发送邮件
-            server = smtplib.SMTP(self.email_config['smtp_server'], self.email_config['smtp_port'])
-            server.starttls()
-            server.login(self.email_config['sender_email'], self.email_config['sender_password'])
+                        msg.attach(_build_attachment(file_path))
             
-            text = msg.as_string()
-            server.sendmail(self.email_config['sender_email'], self.email_config['receiver_emails'], text)
-            server.quit()
+            # 发送邮件，复用已建立的连接；连接被服务器断开时重连一次
+            try:
+                self._send_via(self._get_smtp(), msg)
+            except smtplib.SMTPServerDisconnected:
+                self._smtp = None
+                self._send_via(self._get_smtp(), msg)
             
             logger.info(f"邮件发送成功，发送给: {', '.join(self.email_config['receiver_emails'])}")
             return True
@@ -245,58 +404,115 @@ class NotificationSender:
             logger.error(f"邮件发送失败: {e}")
             return False
     
-    def generate_wechat_content(self, summary: Dict, jobs: List[Dict]) -> str:
+    def _get_smtp(self) -> smtplib.SMTP:
+        """
+        获取复用的SMTP连接，连接失效时重新建立
+        
+        Returns:
+            已完成STARTTLS和登录的SMTP连接
+        """
+        if self._smtp is not None:
+            try:
+                if self._smtp.noop()[0] == 250:
+                    return self._smtp
+            except (smtplib.SMTPException, OSError):
+                pass
+            # 只关闭失效的SMTP连接，HTTP会话可能正被企业微信/Server酱推送线程使用
+            self._close_smtp()
+        
+        server = smtplib.SMTP(self.email_config['smtp_server'], self.email_config['smtp_port'], timeout=30)
+        try:
+            server.starttls()
+            server.ehlo()
+            server.login(self.email_config['sender_email'], self.email_config['sender_password'])
+        except Exception:
+            server.close()
+            raise
+        
+        self._smtp = server
+        return server
+    
+    def _send_via(self, smtp: smtplib.SMTP, msg: MIMEMultipart):
+        """
+        通过指定连接发送邮件，所有收件人在同一次会话中投递
+        
+        Args:
+            smtp: SMTP连接
+            msg: 邮件对象
+        """
+        smtp.send_message(
+            msg,
+            from_addr=self.email_config['sender_email'],
+            to_addrs=self.email_config['receiver_emails']
+        )
+    
+    def close(self):
+        """关闭复用的SMTP连接和HTTP会话"""
+        self._http.close()
+        self._close_smtp()
+    
+    def _close_smtp(self):
+        """关闭复用的SMTP连接"""
+        if self._smtp is None:
+            return
+        try:
+            self._smtp.quit()
+        except (smtplib.SMTPException, OSError):
+            self._smtp.close()
+        self._smtp = None
+    
+    def generate_wechat_content(self, summary: Dict, jobs: List[Dict], timestamp: Optional[str] = None) -> str:
         """
         生成企业微信消息内容
         
         Args:
             summary: 汇总信息
             jobs: 招聘信息列表
+            timestamp: 报告时间，默认取当前时间
             
         Returns:
             消息内容
         """
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        timestamp = timestamp or _now()
         job_count = len(jobs)
+        stats = summary.get('statistics', {})
         
-        content = f"""🎬 招聘信息监控报告
+        # 先收集各段内容，最后一次性拼接
+        parts = [f"""🎬 招聘信息监控报告
 📅 时间: {timestamp}
 
 📊 统计信息:
-• 总文章数: {summary.get('statistics', {}).get('total_articles', 0)}
-• 招聘相关: {summary.get('statistics', {}).get('job_related_articles', 0)}
-• 确认招聘: {summary.get('statistics', {}).get('confirmed_job_postings', 0)}
+• 总文章数: {stats.get('total_articles', 0)}
+• 招聘相关: {stats.get('job_related_articles', 0)}
+• 确认招聘: {stats.get('confirmed_job_postings', 0)}
 • 提取职位: {job_count}
 
-"""
+"""]
         
         if jobs:
-            content += "🔍 招聘信息摘要:\n"
-            for i, job in enumerate(jobs[:5], 1):  # 只显示前5个
-                salary_text = ""
-                if job.get('salary_min') and job.get('salary_max'):
-                    salary_text = f" | 💰 {job['salary_min']}-{job['salary_max']}"
-                elif job.get('salary_original'):
-                    salary_text = f" | 💰 {job['salary_original']}"
+            parts.append("🔍 招聘信息摘要:\n")
+            for i, job in enumerate(_prerender_jobs(jobs[:5]), 1):  # 只显示前5个
+                salary_text = f" | 💰 {job['salary_brief']}" if job['salary_brief'] else ""
                 
-                content += f"{i}. {job.get('job_title', '未知职位')} @ {job.get('company_name', '未知公司')}{salary_text}\n"
+                parts.append(f"{i}. {job.get('job_title', '未知职位')} @ {job.get('company_name', '未知公司')}{salary_text}\n")
             
             if len(jobs) > 5:
-                content += f"... 还有 {len(jobs) - 5} 个职位，详情请查看邮件\n"
+                parts.append(f"... 还有 {len(jobs) - 5} 个职位，详情请查看邮件\n")
         else:
-            content += "本次监控未发现新的招聘信息\n"
+            parts.append("本次监控未发现新的招聘信息\n")
         
-        content += "\n📧 详细信息请查看邮件附件"
+        parts.append("\n📧 详细信息请查看邮件附件")
         
-        return content
+        return "".join(parts)
     
-    def send_wechat_notification(self, summary: Dict, jobs: List[Dict]) -> bool:
+    def send_wechat_notification(self, summary: Dict, jobs: List[Dict], timestamp: Optional[str] = None) -> bool:
         """
         发送企业微信通知
         
         Args:
             summary: 汇总信息
             jobs: 招聘信息列表
+            timestamp: 报告时间，默认取当前时间
             
         Returns:
             发送是否成功
@@ -306,7 +522,7 @@ class NotificationSender:
             return False
         
         try:
-            content = self.generate_wechat_content(summary, jobs)
+            content = self.generate_wechat_content(summary, jobs, timestamp)
             
             # 构建消息数据
             data = {
@@ -320,10 +536,10 @@ class NotificationSender:
             if self.wechat_config['mentioned_list']:
                 data["text"]["mentioned_list"] = self.wechat_config['mentioned_list']
             
-            # 发送请求
-            response = requests.post(
+            # 发送请求，消息体预先用orjson序列化
+            response = self._http.post(
                 self.wechat_config['webhook_url'],
-                json=data,
+                data=orjson.dumps(data),
                 headers={'Content-Type': 'application/json'},
                 timeout=10
             )
@@ -342,24 +558,25 @@ class NotificationSender:
             logger.error(f"企业微信通知发送失败: {e}")
             return False
     
-    def send_server_chan_notification(self, summary: Dict, jobs: List[Dict]) -> bool:
+    def send_server_chan_notification(self, summary: Dict, jobs: List[Dict], timestamp: Optional[str] = None) -> bool:
         """
         发送Server酱通知
         
         Args:
             summary: 汇总信息
             jobs: 招聘信息列表
+            timestamp: 报告时间，默认取当前时间
             
         Returns:
             发送是否成功
         """
-        server_chan_key = os.getenv('SERVER_CHAN_KEY', '')
+        server_chan_key = self.server_chan_key
         if not server_chan_key:
             logger.warning("Server酱配置不完整，跳过通知")
             return False
         
         try:
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            timestamp = timestamp or _now()
             job_count = len(jobs)
             
             if job_count > 0:
@@ -367,21 +584,23 @@ class NotificationSender:
             else:
                 title = f"📄 招聘信息监控报告"
             
-            content = f"""
+            stats = summary.get('statistics', {})
+            parts = [f"""
 时间: {timestamp}
 
 统计信息:
-- 总文章数: {summary.get('statistics', {}).get('total_articles', 0)}
-- 招聘相关: {summary.get('statistics', {}).get('job_related_articles', 0)}
-- 确认招聘: {summary.get('statistics', {}).get('confirmed_job_postings', 0)}
+- 总文章数: {stats.get('total_articles', 0)}
+- 招聘相关: {stats.get('job_related_articles', 0)}
+- 确认招聘: {stats.get('confirmed_job_postings', 0)}
 - 提取职位: {job_count}
 
-"""
+"""]
             
             if jobs:
-                content += "招聘信息摘要:\n"
+                parts.append("招聘信息摘要:\n")
                 for i, job in enumerate(jobs[:3], 1):  # 只显示前3个
-                    content += f"{i}. {job.get('job_title', '未知职位')} @ {job.get('company_name', '未知公司')}\n"
+                    parts.append(f"{i}. {job.get('job_title', '未知职位')} @ {job.get('company_name', '未知公司')}\n")
+            content = "".join(parts)
             
             # 发送到Server酱
             url = f"https://sctapi.ftqq.com/{server_chan_key}.send"
@@ -390,7 +609,7 @@ class NotificationSender:
                 'desp': content
             }
             
-            response = requests.post(url, data=data, timeout=10)
+            response = self._http.post(url, data=data, timeout=10)
             response.raise_for_status()
             
             result = response.json()
@@ -417,20 +636,30 @@ class NotificationSender:
         Returns:
             发送结果
         """
-        results = {}
+        # 薪资、联系方式等展示文本和报告时间只生成一次，供各渠道共用
+        jobs = _prerender_jobs(jobs)
+        timestamp = _now()
+        
+        tasks = {}
         
         # 发送邮件
         if self.email_config['sender_email']:
-            results['email'] = self.send_email(summary, jobs, attachments)
+            tasks['email'] = (self.send_email, summary, jobs, attachments, timestamp)
         
         # 发送企业微信
         if self.wechat_config['webhook_url']:
-            results['wechat'] = self.send_wechat_notification(summary, jobs)
+            tasks['wechat'] = (self.send_wechat_notification, summary, jobs, timestamp)
         
         # 发送Server酱
-        server_chan_key = os.getenv('SERVER_CHAN_KEY', '')
-        if server_chan_key:
-            results['server_chan'] = self.send_server_chan_notification(summary, jobs)
+        if self.server_chan_key:
+            tasks['server_chan'] = (self.send_server_chan_notification, summary, jobs, timestamp)
+        
+        # 各通知渠道互不依赖，并发发送，总耗时取决于最慢的渠道而不是各渠道耗时之和
+        results = {}
+        if tasks:
+            with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
+                futures = {name: executor.submit(*task) for name, task in tasks.items()}
+                results = {name: future.result() for name, future in futures.items()}
         
         # 统计发送结果
         success_count = sum(1 for success in results.values() if success)
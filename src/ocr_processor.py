@@ -7,8 +7,13 @@ OCR图片识别模块
 
 import os
 import logging
+import re
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from typing import List, Dict, Optional, Union
-import json
+import orjson
 from PIL import Image
 import numpy as np
 
@@ -23,6 +28,61 @@ except ImportError:
     logger.warning("PaddleOCR未安装，请运行: pip install paddleocr")
     PADDLEOCR_AVAILABLE = False
 
+# 批量识别时预先读取和预处理的图片数量
+PREFETCH_IMAGES = 4
+
+# 识别结果的最低置信度，低于该值的文字行会被丢弃
+OCR_MIN_CONFIDENCE = 0.5
+
+# 招聘相关关键词
+_JOB_KEYWORDS = (
+    # 职位相关
+    '招聘', '求职', '职位', '岗位', '工作', '面试', '简历', '人才',
+    '应聘', '录用', '入职', '试用', '转正', '晋升', 
+
+    # 薪资福利
+    '薪资', '工资', '薪水', '待遇', '福利', '五险一金', '年薪', '月薪',
+    '奖金', '提成', '补贴', '津贴', '保险', '公积金',
+
+    # 工作类型
+    '全职', '兼职', '实习', '临时', '合同', '正式', '试用期',
+    '远程', '居家', '驻场', '出差', '外派',
+
+    # 影视行业特定
+    '副导演', '导演', '制片', '摄影', '剪辑', '后期', '编导',
+    '影视', '传媒', '广告', '制作', '策划', '文案', '运营',
+    '摄像', '录音', '灯光', '美术', '化妆', '服装', '道具',
+    '场记', '统筹', '制片人', '监制', '编剧', '配音', '特效',
+
+    # 技能要求
+    '经验', '学历', '专业', '技能', '能力', '熟练', '精通',
+    '本科', '专科', '硕士', '年以上', '相关经验',
+
+    # 联系方式
+    '联系', '电话', '微信', '邮箱', '地址', '简历发送',
+    '有意者', '请联系', '咨询', '报名'
+)
+
+# 所有关键词编译成一个正则，一次扫描即可找出文本中出现的关键词，候选项按长度降序排列，
+# 保证每个位置优先匹配最长的关键词
+_KW_RE = re.compile('|'.join(re.escape(k) for k in sorted(_JOB_KEYWORDS, key=len, reverse=True)))
+
+# 每个关键词所包含的其他关键词（如"制片人"包含"制片"），匹配到前者时后者必然也出现在文本中
+_KW_CONTAINED = {
+    keyword: frozenset(k for k in _JOB_KEYWORDS if k in keyword)
+    for keyword in _JOB_KEYWORDS
+}
+
+# 正则匹配互不重叠，以某个关键词结尾部分开头的关键词（如"求职"之后的"职位"）可能被漏掉，
+# 需要对这些关键词单独确认
+_KW_OVERLAPPING = {
+    keyword: tuple(
+        k for k in _JOB_KEYWORDS
+        if any(k.startswith(keyword[i:]) and len(k) > len(keyword) - i for i in range(1, len(keyword)))
+    )
+    for keyword in _JOB_KEYWORDS
+}
+
 
 class OCRProcessor:
     """OCR处理器，负责图片文字识别"""
@@ -38,10 +98,16 @@ class OCRProcessor:
         self.use_gpu = use_gpu
         self.lang = lang
         self.ocr = None
+        # PaddleOCR实例不是线程安全的，多线程调用时需要串行化识别过程
+        self._ocr_lock = threading.Lock()
+        # 图片解码和缩放在Pillow中会释放GIL，放到线程池中与OCR识别并行
+        self._preprocess_executor = ThreadPoolExecutor(max_workers=PREFETCH_IMAGES)
         
         if PADDLEOCR_AVAILABLE:
             try:
-                # 初始化PaddleOCR
+                # 初始化PaddleOCR。其预测器创建时已开启显存/内存复用（enable_memory_optim），
+                # 识别前也会自行拷贝输入图片，因此这里不再额外维护固定大小的输入缓冲区：
+                # 先拷贝进缓冲区再传入切片视图只会多一次整帧拷贝
                 self.ocr = PaddleOCR(
                     use_angle_cls=True,  # 使用角度分类器
                     lang=lang,          # 语言
@@ -80,17 +146,10 @@ class OCRProcessor:
                 logger.error(f"图片文件不存在: {image_path}")
                 return None
             
-            # 使用PIL打开图片
+            # 使用PIL打开图片，此时只读取了文件头，像素数据尚未解码
             with Image.open(image_path) as img:
-                # 转换为RGB模式
-                if img.mode != 'RGB':
-                    img = img.convert('RGB')
-                
-                # 转换为numpy数组
-                img_array = np.array(img)
-                
-                # 检查图片尺寸
-                height, width = img_array.shape[:2]
+                # 先根据文件头中的尺寸过滤过小的图片，避免无谓的解码
+                width, height = img.size
                 if height < 10 or width < 10:
                     logger.warning(f"图片尺寸过小: {width}x{height}")
                     return None
@@ -101,11 +160,20 @@ class OCRProcessor:
                     scale = max_size / max(height, width)
                     new_height = int(height * scale)
                     new_width = int(width * scale)
-                    img_resized = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
-                    img_array = np.array(img_resized)
+                    # JPEG可以在解码时按1/2、1/4、1/8直接缩小，解码和缩放的像素量都大幅减少；
+                    # 其他格式调用draft不产生任何效果
+                    img.draft('RGB', (new_width, new_height))
+                    if img.mode != 'RGB':
+                        img = img.convert('RGB')
+                    img = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
                     logger.info(f"图片已缩放: {width}x{height} -> {new_width}x{new_height}")
+                elif img.mode != 'RGB':
+                    # 转换为RGB模式
+                    img = img.convert('RGB')
                 
-                return img_array
+                # 转换为numpy数组，只对最终尺寸的图片做一次拷贝。np.asarray直接复用PIL导出的像素缓冲区，
+                # 不像np.array那样再复制一遍；得到的数组是只读的，PaddleOCR识别前会自行拷贝输入
+                return np.asarray(img)
                 
         except Exception as e:
             logger.error(f"预处理图片失败 {image_path}: {e}")
@@ -129,11 +197,23 @@ class OCRProcessor:
                 'details': []
             }
         
-        try:
-            logger.info(f"开始识别图片: {image_path}")
+        logger.info(f"开始识别图片: {image_path}")
+        
+        # 预处理图片
+        return self._recognize(image_path, self.preprocess_image(image_path))
+    
+    def _recognize(self, image_path: str, img_array: Optional[np.ndarray]) -> Dict:
+        """
+        对预处理后的图片执行OCR识别并解析结果
+        
+        Args:
+            image_path: 图片路径
+            img_array: 预处理后的图片数组，预处理失败时为None
             
-            # 预处理图片
-            img_array = self.preprocess_image(image_path)
+        Returns:
+            识别结果字典
+        """
+        try:
             if img_array is None:
                 return {
                     'success': False,
@@ -143,7 +223,8 @@ class OCRProcessor:
                 }
             
             # 执行OCR识别
-            result = self.ocr.ocr(img_array, cls=True)
+            with self._ocr_lock:
+                result = self.ocr.ocr(img_array, cls=True)
             
             if not result or not result[0]:
                 return {
@@ -153,27 +234,18 @@ class OCRProcessor:
                     'message': '图片中未检测到文字'
                 }
             
-            # 解析识别结果
-            extracted_text = []
-            text_details = []
-            
-            for line in result[0]:
-                if line:
-                    # 获取文字位置和内容
-                    bbox = line[0]  # 边界框坐标
-                    text_info = line[1]  # 文字信息
-                    
-                    if text_info and len(text_info) >= 2:
-                        text = text_info[0]  # 识别的文字
-                        confidence = text_info[1]  # 置信度
-                        
-                        if text and confidence > 0.5:  # 过滤置信度低的结果
-                            extracted_text.append(text)
-                            text_details.append({
-                                'text': text,
-                                'confidence': confidence,
-                                'bbox': bbox
-                            })
+            # 解析识别结果：每行为 [边界框坐标, (识别的文字, 置信度)]，过滤置信度低的结果
+            text_details = [
+                {
+                    'text': text_info[0],
+                    'confidence': text_info[1],
+                    'bbox': line[0]
+                }
+                for line in result[0] if line
+                for text_info in (line[1],)
+                if text_info and len(text_info) >= 2 and text_info[0] and text_info[1] > OCR_MIN_CONFIDENCE
+            ]
+            extracted_text = [detail['text'] for detail in text_details]
             
             # 合并所有文字
             full_text = '\n'.join(extracted_text)
@@ -207,15 +279,79 @@ class OCRProcessor:
         Returns:
             识别结果列表
         """
+        if not self.is_available():
+            return [self.extract_text_from_image(image_path) for image_path in image_paths]
+        
+        # 图片读取和预处理提交到线程池，在识别当前图片的同时准备后续图片；
+        # 预取窗口限制了同时驻留内存的图片数量
         results = []
+        pending = deque()
+        remaining = iter(image_paths)
+        
+        for image_path in islice(remaining, PREFETCH_IMAGES):
+            pending.append((image_path, self._preprocess_executor.submit(self.preprocess_image, image_path)))
         
-        for image_path in image_paths:
-            result = self.extract_text_from_image(image_path)
-            results.append(result)
+        while pending:
+            image_path, future = pending.popleft()
+            next_path = next(remaining, None)
+            if next_path is not None:
+                pending.append((next_path, self._preprocess_executor.submit(self.preprocess_image, next_path)))
+            
+            logger.info(f"开始识别图片: {image_path}")
+            results.append(self._recognize(image_path, future.result()))
         
         logger.info(f"批量识别完成，共处理 {len(image_paths)} 张图片")
         return results
     
+    def is_job_related(self, text: str) -> bool:
+        """
+        快速判断文字是否与招聘相关，命中2个关键词即返回，不统计全部关键词
+        
+        Args:
+            text: 识别的文字
+            
+        Returns:
+            是否与招聘相关，与filter_job_related_text的判断结果一致
+        """
+        if not text:
+            return False
+        
+        matched = set()
+        hits = []
+        for match in _KW_RE.finditer(text):
+            keyword = match.group()
+            matched |= _KW_CONTAINED[keyword]
+            if len(matched) >= 2:
+                return True
+            hits.append(keyword)
+        
+        # 只命中不足2个关键词时，再确认与已命中关键词重叠、被正则跳过的关键词
+        for keyword in hits:
+            for candidate in _KW_OVERLAPPING[keyword]:
+                if candidate not in matched and candidate in text:
+                    matched |= _KW_CONTAINED[candidate]
+        return len(matched) >= 2
+    
+    @staticmethod
+    def _unrelated_text_result(text: str) -> Dict:
+        """
+        与招聘无关的文字的过滤结果，字段与filter_job_related_text的完整结果相同
+        
+        Args:
+            text: 识别的文字
+            
+        Returns:
+            过滤结果
+        """
+        return {
+            'is_job_related': False,
+            'job_keywords': [],
+            'filtered_text': text,
+            'confidence': 0.0,
+            'keyword_count': 0,
+            'total_keywords': len(_JOB_KEYWORDS)
+        }
+    
     def filter_job_related_text(self, text: str) -> Dict:
         """
         过滤和提取招聘相关的文字信息
@@ -234,56 +370,34 @@ class OCRProcessor:
                 'confidence': 0.0
             }
         
-        # 招聘相关关键词
-        job_keywords = [
-            # 职位相关
-            '招聘', '求职', '职位', '岗位', '工作', '面试', '简历', '人才',
-            '应聘', '录用', '入职', '试用', '转正', '晋升', 
-            
-            # 薪资福利
-            '薪资', '工资', '薪水', '待遇', '福利', '五险一金', '年薪', '月薪',
-            '奖金', '提成', '补贴', '津贴', '保险', '公积金',
-            
-            # 工作类型
-            '全职', '兼职', '实习', '临时', '合同', '正式', '试用期',
-            '远程', '居家', '驻场', '出差', '外派',
-            
-            # 影视行业特定
-            '副导演', '导演', '制片', '摄影', '剪辑', '后期', '编导',
-            '影视', '传媒', '广告', '制作', '策划', '文案', '运营',
-            '摄像', '录音', '灯光', '美术', '化妆', '服装', '道具',
-            '场记', '统筹', '制片人', '监制', '编剧', '配音', '特效',
-            
-            # 技能要求
-            '经验', '学历', '专业', '技能', '能力', '熟练', '精通',
-            '本科', '专科', '硕士', '年以上', '相关经验',
-            
-            # 联系方式
-            '联系', '电话', '微信', '邮箱', '地址', '简历发送',
-            '有意者', '请联系', '咨询', '报名'
-        ]
         
         # 统计关键词出现次数
-        found_keywords = []
-        text_lower = text.lower()
+        hits = set(_KW_RE.findall(text))
+        if not hits:
+            # 大部分OCR文字与招聘无关，未命中任何关键词时直接返回，跳过后续的统计和分句
+            return self._unrelated_text_result(text)
         
-        for keyword in job_keywords:
-            if keyword in text:
-                found_keywords.append(keyword)
+        matched = set()
+        for keyword in hits:
+            matched |= _KW_CONTAINED[keyword]
+        for keyword in hits:
+            for candidate in _KW_OVERLAPPING[keyword]:
+                if candidate not in matched and candidate in text:
+                    matched |= _KW_CONTAINED[candidate]
+        found_keywords = [keyword for keyword in _JOB_KEYWORDS if keyword in matched]
         
         # 计算相关性得分
-        relevance_score = len(found_keywords) / len(job_keywords) if job_keywords else 0
+        relevance_score = len(found_keywords) / len(_JOB_KEYWORDS)
         
         # 判断是否与招聘相关
         is_job_related = len(found_keywords) >= 2  # 至少包含2个关键词
         
-        # 提取包含关键词的句子
-        sentences = text.split('\n')
-        relevant_sentences = []
-        
-        for sentence in sentences:
-            if any(keyword in sentence for keyword in found_keywords):
-                relevant_sentences.append(sentence.strip())
+        # 提取包含关键词的句子，句子中出现的关键词必然在found_keywords中，
+        # 直接用同一个正则判断，不再逐个关键词检查
+        search = _KW_RE.search
+        relevant_sentences = [
+            sentence.strip() for sentence in text.split('\n') if search(sentence)
+        ] if found_keywords else []
         
         filtered_text = '\n'.join(relevant_sentences) if relevant_sentences else text
         
@@ -293,7 +407,7 @@ class OCRProcessor:
             'filtered_text': filtered_text,
             'confidence': relevance_score,
             'keyword_count': len(found_keywords),
-            'total_keywords': len(job_keywords)
+            'total_keywords': len(_JOB_KEYWORDS)
         }
     
     def process_article_images(self, article: Dict) -> Dict:
@@ -314,16 +428,23 @@ class OCRProcessor:
         ocr_results = []
         all_image_text = []
         
+        image_paths = []
         for image_info in article['images']:
             local_path = image_info.get('local_path')
             if not local_path or not os.path.exists(local_path):
                 logger.warning(f"图片文件不存在: {local_path}")
                 continue
-            
-            # 执行OCR识别
-            ocr_result = self.extract_text_from_image(local_path)
-            
+            image_paths.append(local_path)
+        
+        # 执行OCR识别，文章内的图片走批量接口，图片读取与识别并行进行
+        for ocr_result in self.extract_text_from_images(image_paths):
             if ocr_result['success'] and ocr_result['text']:
+                # 先快速判断是否与招聘相关，只对相关的文字做完整的关键词统计和分句过滤
+                if not self.is_job_related(ocr_result['text']):
+                    ocr_result.update(self._unrelated_text_result(ocr_result['text']))
+                    ocr_results.append(ocr_result)
+                    continue
+                
                 # 过滤招聘相关文字
                 filtered_result = self.filter_job_related_text(ocr_result['text'])
                 
@@ -355,8 +476,8 @@ class OCRProcessor:
             output_file: 输出文件路径
         """
         try:
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(results, f, ensure_ascii=False, indent=2)
+            with open(output_file, 'wb') as f:
+                f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
             logger.info(f"OCR结果已保存到: {output_file}")
         except Exception as e:
             logger.error(f"保存OCR结果失败: {e}")
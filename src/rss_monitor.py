@@ -7,19 +7,84 @@ RSS监控模块
 
 import feedparser
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import hashlib
+import importlib.util
 import json
+import mmap
+import orjson
 import os
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
-import time
+from email.utils import parsedate_tz
+from typing import List, Dict, Optional, Set
 import logging
 from bs4 import BeautifulSoup
 import re
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+from urllib.parse import urlparse
 
 # 配置日志
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# HTML解析器，优先使用C实现的lxml，未安装时退回标准库html.parser
+LXML_AVAILABLE = importlib.util.find_spec('lxml') is not None
+HTML_PARSER = 'lxml' if LXML_AVAILABLE else 'html.parser'
+
+# 下载的图片只供OCR识别使用，未安装PaddleOCR时不下载图片
+OCR_AVAILABLE = importlib.util.find_spec('paddleocr') is not None
+
+# 招聘相关关键词
+JOB_KEYWORDS = (
+    '招聘', '求职', '职位', '岗位', '工作', '面试', '简历',
+    '薪资', '工资', '待遇', '福利', '全职', '兼职', '实习',
+    '副导演', '导演', '制片', '摄影', '剪辑', '后期', '编导',
+    '影视', '传媒', '广告', '制作', '策划', '文案', '运营'
+)
+
+# 关键词编译为单个正则，一次扫描即可判断文本中是否出现任一关键词。
+# 关键词匹配的选择顺序：Aho-Corasick自动机（需额外依赖）> 单个正则多选 > 逐个关键词 in 判断；
+# 文本未分词，按分词结果求集合交集需要先做一遍分词（如jieba），开销比正则扫描更大
+_JOB_KEYWORD_RE = re.compile('|'.join(map(re.escape, JOB_KEYWORDS)))
+
+# 摘要中出现这些字符时才需要HTML解析：标签、实体，以及解析器会规范化的回车和空字符
+_HTML_MARKUP_RE = re.compile('[<&\r\x00]')
+
+# 最多记录的已处理文章数量
+MAX_SEEN_GUIDS = 50000
+
+# 并发下载RSS源的最大线程数
+MAX_FEED_WORKERS = 8
+
+# 并发下载图片的最大线程数
+MAX_IMAGE_WORKERS = 16
+
+# 单张图片的大小上限、流式下载的分块大小，以及先缓存在内存中再一次写入的上限
+MAX_IMAGE_BYTES = 10 * 1024 * 1024
+IMAGE_CHUNK_SIZE = 64 * 1024
+IMAGE_BUFFER_BYTES = 1024 * 1024
+
+# 保留原扩展名的图片类型，其他情况（如微信图片地址没有扩展名）统一保存为.jpg
+IMAGE_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.gif', '.webp', '.bmp'}
+
+
+def _atomic_write(path: str, data: bytes):
+    """
+    原子写入文件：先写临时文件并落盘，再替换目标文件，进程中途被终止也不会留下写了一半的文件
+    
+    Args:
+        path: 目标文件路径
+        data: 文件内容
+    """
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
 
 class RSSMonitor:
     """RSS监控器，负责获取和解析微信公众号RSS源"""
@@ -34,9 +99,22 @@ class RSSMonitor:
         self.data_dir = data_dir
         self.last_check_file = os.path.join(data_dir, "last_check.json")
         self.articles_cache_file = os.path.join(data_dir, "articles_cache.json")
+        # 文章正文单独存放，缓存文件中只保留元数据和正文路径
+        self.content_dir = os.path.join(data_dir, "content")
+        # RSS源内容缓存放在cache目录下，CI中随其他缓存一起在多次运行间保留
+        self.feed_cache_dir = os.path.join(data_dir, "cache", "feeds")
+        self.feed_meta_file = os.path.join(self.feed_cache_dir, "feed_meta.json")
+        self.seen_guids_file = os.path.join(data_dir, "cache", "seen_guids.json")
         
         # 确保数据目录存在
         os.makedirs(data_dir, exist_ok=True)
+        os.makedirs(self.feed_cache_dir, exist_ok=True)
+        
+        # 各RSS源上次响应的ETag/Last-Modified，用于条件请求
+        self._feed_meta = self.load_feed_meta()
+        
+        # 已处理过的文章标识，按加入顺序保存，再次出现时跳过解析
+        self._seen_guids = dict.fromkeys(self.load_seen_guids())
         
         # 请求头，模拟浏览器访问
         self.headers = {
@@ -46,6 +124,17 @@ class RSSMonitor:
             'Accept-Encoding': 'gzip, deflate',
             'Connection': 'keep-alive',
         }
+        
+        # 复用连接的HTTP会话，RSS源和图片多次访问同一主机时不必重新建立TCP/TLS连接
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=32,
+            max_retries=Retry(total=2, backoff_factor=0.3)
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
     
     def load_rss_sources(self, config_file: str = "config/rss_sources.json") -> List[Dict]:
         """
@@ -78,8 +167,8 @@ class RSSMonitor:
         """
         try:
             if os.path.exists(self.last_check_file):
-                with open(self.last_check_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                with open(self.last_check_file, 'rb') as f:
+                    data = orjson.loads(f.read())
                     return datetime.fromisoformat(data['last_check'])
             else:
                 # 如果没有记录，返回24小时前的时间
@@ -97,11 +186,59 @@ class RSSMonitor:
         """
         try:
             data = {'last_check': check_time.isoformat()}
-            with open(self.last_check_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            _atomic_write(self.last_check_file, orjson.dumps(data, option=orjson.OPT_INDENT_2))
         except Exception as e:
             logger.error(f"保存检查时间失败: {e}")
     
+    def load_feed_meta(self) -> Dict:
+        """
+        加载各RSS源的缓存校验信息
+        
+        Returns:
+            {RSS地址: {'etag': ..., 'last_modified': ...}}
+        """
+        try:
+            if os.path.exists(self.feed_meta_file):
+                with open(self.feed_meta_file, 'rb') as f:
+                    return orjson.loads(f.read())
+        except Exception as e:
+            logger.error(f"读取RSS缓存信息失败: {e}")
+        return {}
+    
+    def save_feed_meta(self):
+        """保存各RSS源的缓存校验信息"""
+        try:
+            _atomic_write(self.feed_meta_file, orjson.dumps(self._feed_meta, option=orjson.OPT_INDENT_2))
+        except Exception as e:
+            logger.error(f"保存RSS缓存信息失败: {e}")
+    
+    def load_seen_guids(self) -> List[str]:
+        """
+        加载已处理过的文章标识
+        
+        Returns:
+            文章标识列表，按处理顺序排列
+        """
+        try:
+            if os.path.exists(self.seen_guids_file):
+                with open(self.seen_guids_file, 'rb') as f:
+                    return orjson.loads(f.read())
+        except Exception as e:
+            logger.error(f"读取已处理文章记录失败: {e}")
+        return []
+    
+    def save_seen_guids(self):
+        """保存已处理过的文章标识，只保留最近的MAX_SEEN_GUIDS条"""
+        try:
+            guids = list(self._seen_guids)[-MAX_SEEN_GUIDS:]
+            _atomic_write(self.seen_guids_file, orjson.dumps(guids))
+        except Exception as e:
+            logger.error(f"保存已处理文章记录失败: {e}")
+    
+    def _feed_cache_path(self, rss_url: str) -> str:
+        """RSS源内容的本地缓存文件路径"""
+        return os.path.join(self.feed_cache_dir, hashlib.sha1(rss_url.encode('utf-8')).hexdigest() + '.xml')
+    
     def fetch_rss_feed(self, rss_url: str, timeout: int = 30) -> Optional[feedparser.FeedParserDict]:
         """
         获取RSS源内容
@@ -116,12 +253,42 @@ class RSSMonitor:
         try:
             logger.info(f"正在获取RSS源: {rss_url}")
             
-            # 使用requests获取RSS内容
-            response = requests.get(rss_url, headers=self.headers, timeout=timeout)
-            response.raise_for_status()
-            
-            # 解析RSS内容
-            feed = feedparser.parse(response.content)
+            # 有本地缓存时带上ETag/Last-Modified发起条件请求，RSS源未更新时服务器只返回304
+            cache_file = self._feed_cache_path(rss_url)
+            meta = self._feed_meta.get(rss_url, {})
+            headers = {}
+            if os.path.exists(cache_file):
+                if meta.get('etag'):
+                    headers['If-None-Match'] = meta['etag']
+                if meta.get('last_modified'):
+                    headers['If-Modified-Since'] = meta['last_modified']
+            
+            # 流式获取RSS内容，响应体不再整体读入内存后再交给feedparser
+            with self.session.get(rss_url, headers=headers, timeout=timeout, stream=True) as response:
+                if response.status_code == 304:
+                    logger.info(f"RSS源未更新，使用本地缓存: {rss_url}")
+                    with open(cache_file, 'rb') as f:
+                        feed = self._parse_feed(f)
+                else:
+                    response.raise_for_status()
+                    
+                    etag = response.headers.get('ETag')
+                    last_modified = response.headers.get('Last-Modified')
+                    if etag or last_modified:
+                        # 边下载边写入缓存文件，再从缓存文件解析
+                        tmp_path = cache_file + '.tmp'
+                        with open(tmp_path, 'wb') as f:
+                            for chunk in response.iter_content(chunk_size=IMAGE_CHUNK_SIZE):
+                                f.write(chunk)
+                        os.replace(tmp_path, cache_file)
+                        self._feed_meta[rss_url] = {'etag': etag, 'last_modified': last_modified}
+                        
+                        with open(cache_file, 'rb') as f:
+                            feed = self._parse_feed(f)
+                    else:
+                        self._feed_meta.pop(rss_url, None)
+                        response.raw.decode_content = True
+                        feed = self._parse_feed(response.raw)
             
             if feed.bozo:
                 logger.warning(f"RSS源可能有格式问题: {rss_url}")
@@ -136,62 +303,89 @@ class RSSMonitor:
             logger.error(f"解析RSS源失败 {rss_url}: {e}")
             return None
     
-    def parse_article_content(self, entry) -> Dict:
+    def _parse_feed(self, stream) -> feedparser.FeedParserDict:
+        """
+        解析RSS内容
+        
+        Args:
+            stream: RSS内容的文件对象
+            
+        Returns:
+            RSS解析结果
+        """
+        # 摘要HTML只用于提取纯文本和图片地址，不会被渲染，
+        # 因此关闭feedparser的HTML清洗，省去对每篇摘要的二次HTML解析
+        return feedparser.parse(stream, sanitize_html=False)
+    
+    def get_entry_published(self, entry) -> datetime:
+        """
+        解析RSS条目的发布时间
+        
+        Args:
+            entry: RSS条目
+            
+        Returns:
+            发布时间，无法解析时返回当前时间
+        """
+        published_parsed = getattr(entry, 'published_parsed', None)
+        if published_parsed:
+            return datetime(*published_parsed[:6])
+        
+        # feedparser未能解析时按RFC 2822格式解析；parsedate_tz对无效格式返回None而不抛出异常
+        parsed = parsedate_tz(getattr(entry, 'published', None) or '')
+        if parsed:
+            try:
+                # 与published_parsed一致，换算为不带时区的UTC时间
+                return datetime(*parsed[:6]) - timedelta(seconds=parsed[9] or 0)
+            except ValueError:
+                pass
+        return datetime.now()
+    
+    def parse_article_content(self, entry, published: datetime = None) -> Dict:
         """
         解析文章内容
         
         Args:
             entry: RSS条目
+            published: 已解析的发布时间，为空时从条目中解析
             
         Returns:
             解析后的文章信息
         """
         try:
             # 获取文章基本信息
-            title = entry.title if hasattr(entry, 'title') else "无标题"
-            link = entry.link if hasattr(entry, 'link') else ""
-            summary = entry.summary if hasattr(entry, 'summary') else ""
+            title = getattr(entry, 'title', "无标题")
+            link = getattr(entry, 'link', "")
+            summary = getattr(entry, 'summary', "")
             
             # 解析发布时间
-            published = None
-            if hasattr(entry, 'published_parsed') and entry.published_parsed:
-                published = datetime(*entry.published_parsed[:6])
-            elif hasattr(entry, 'published'):
-                try:
-                    published = datetime.strptime(entry.published, '%a, %d %b %Y %H:%M:%S %z')
-                except:
-                    published = datetime.now()
-            else:
-                published = datetime.now()
-            
-            # 使用BeautifulSoup解析HTML内容
-            soup = BeautifulSoup(summary, 'html.parser')
+            if published is None:
+                published = self.get_entry_published(entry)
             
-            # 提取纯文本内容
-            text_content = soup.get_text(strip=True)
-            
-            # 提取图片链接
             images = []
-            img_tags = soup.find_all('img')
-            for img in img_tags:
-                src = img.get('src', '')
-                if src:
-                    images.append({
-                        'url': src,
-                        'alt': img.get('alt', ''),
-                        'title': img.get('title', '')
-                    })
-            
-            # 检查是否包含招聘相关关键词
-            job_keywords = [
-                '招聘', '求职', '职位', '岗位', '工作', '面试', '简历', 
-                '薪资', '工资', '待遇', '福利', '全职', '兼职', '实习',
-                '副导演', '导演', '制片', '摄影', '剪辑', '后期', '编导',
-                '影视', '传媒', '广告', '制作', '策划', '文案', '运营'
-            ]
-            
-            is_job_related = any(keyword in text_content or keyword in title 
-                               for keyword in job_keywords)
+            if not _HTML_MARKUP_RE.search(summary):
+                # 纯文本摘要（没有标签和实体）解析结果与原文一致，不必调用HTML解析器
+                text_content = summary.strip()
+            else:
+                # 使用BeautifulSoup解析HTML内容
+                soup = BeautifulSoup(summary, HTML_PARSER)
+                
+                # 提取纯文本内容
+                text_content = soup.get_text(strip=True)
+                
+                # 提取图片链接
+                img_tags = soup.find_all('img')
+                for img in img_tags:
+                    src = img.get('src', '')
+                    if src:
+                        images.append({
+                            'url': src,
+                            'alt': img.get('alt', ''),
+                            'title': img.get('title', '')
+                        })
+            
+            # 检查是否包含招聘相关关键词，先查较短的标题，命中时不必扫描正文
+            is_job_related = bool(_JOB_KEYWORD_RE.search(title) or _JOB_KEYWORD_RE.search(text_content))
             
             article = {
                 'title': title,
@@ -222,29 +416,100 @@ class RSSMonitor:
         Returns:
             本地图片路径
         """
+        tmp_path = None
         try:
             if not save_dir:
                 save_dir = os.path.join(self.data_dir, "images")
                 os.makedirs(save_dir, exist_ok=True)
             
-            # 生成文件名
-            filename = f"img_{int(time.time())}_{hash(image_url) % 10000}.jpg"
+            # 按URL哈希生成文件名，不同图片不会互相覆盖；同一图片已下载过时直接复用
+            ext = os.path.splitext(urlparse(image_url).path)[1].lower()
+            if ext not in IMAGE_EXTENSIONS:
+                ext = '.jpg'
+            filename = 'img_' + hashlib.blake2b(image_url.encode('utf-8'), digest_size=10).hexdigest() + ext
             file_path = os.path.join(save_dir, filename)
+            if os.path.exists(file_path):
+                logger.info(f"图片已存在，跳过下载: {file_path}")
+                return file_path
             
-            # 下载图片
-            response = requests.get(image_url, headers=self.headers, timeout=30)
-            response.raise_for_status()
-            
-            with open(file_path, 'wb') as f:
-                f.write(response.content)
+            # 先写入临时文件，下载完整后再重命名，中途失败不会留下残缺的图片
+            tmp_path = file_path + '.part'
             
+            # 流式下载图片，边下载边写入文件，超过大小上限时放弃
+            with self.session.get(image_url, timeout=30, stream=True) as response:
+                response.raise_for_status()
+                
+                content_length = int(response.headers.get('Content-Length') or 0)
+                if content_length > MAX_IMAGE_BYTES:
+                    logger.warning(f"图片过大，跳过下载 {image_url}: {content_length} 字节")
+                    return None
+                
+                # 小图片先在内存中拼接，最后一次写入文件；超过缓冲上限后改为逐块写入，避免占用过多内存
+                chunks = []
+                written = 0
+                f = None
+                try:
+                    for chunk in response.iter_content(chunk_size=IMAGE_CHUNK_SIZE):
+                        written += len(chunk)
+                        if written > MAX_IMAGE_BYTES:
+                            break
+                        if f is not None:
+                            f.write(chunk)
+                            continue
+                        chunks.append(chunk)
+                        if written > IMAGE_BUFFER_BYTES:
+                            f = open(tmp_path, 'wb')
+                            f.write(b''.join(chunks))
+                            chunks = []
+                    
+                    if written > MAX_IMAGE_BYTES:
+                        if f is not None:
+                            f.close()
+                            f = None
+                            os.remove(tmp_path)
+                        logger.warning(f"图片过大，已放弃下载 {image_url}")
+                        return None
+                    
+                    if f is None:
+                        with open(tmp_path, 'wb') as out:
+                            out.write(b''.join(chunks))
+                finally:
+                    if f is not None:
+                        f.close()
+            
+            os.replace(tmp_path, file_path)
             logger.info(f"图片下载成功: {file_path}")
             return file_path
             
         except Exception as e:
             logger.error(f"下载图片失败 {image_url}: {e}")
+            if tmp_path and os.path.exists(tmp_path):
+                os.remove(tmp_path)
             return None
     
+    def download_article_images(self, articles: List[Dict]):
+        """
+        并发下载文章中的所有图片，并把本地路径写回对应的图片信息
+        
+        Args:
+            articles: 文章列表
+        """
+        images = [image for article in articles for image in article['images']]
+        if not images:
+            return
+        
+        # 同一图片（封面、头像、公众号logo等）常被多篇文章引用，每个地址只下载一次
+        unique_urls = list(dict.fromkeys(image['url'] for image in images))
+        
+        # 图片下载是网络IO，线程池并发下载，总耗时不再是所有图片下载时间之和
+        with ThreadPoolExecutor(max_workers=min(MAX_IMAGE_WORKERS, len(unique_urls))) as executor:
+            local_paths = dict(zip(unique_urls, executor.map(self.download_image, unique_urls)))
+        
+        for image in images:
+            local_path = local_paths[image['url']]
+            if local_path:
+                image['local_path'] = local_path
+    
     def get_new_articles(self, rss_sources: List[Dict], since_time: datetime = None) -> List[Dict]:
         """
         获取新文章
@@ -259,51 +524,75 @@ class RSSMonitor:
         if since_time is None:
             since_time = self.get_last_check_time()
         
-        all_new_articles = []
+        # (发布时间, 文章)，排序直接使用已解析的datetime，不再比较ISO字符串
+        new_entries = []
         
+        valid_sources = []
         for source in rss_sources:
-            try:
-                source_name = source.get('name', '未知来源')
-                rss_url = source.get('url', '')
-                
-                if not rss_url:
-                    logger.warning(f"跳过无效的RSS源: {source_name}")
-                    continue
-                
-                logger.info(f"正在检查RSS源: {source_name}")
-                
-                # 获取RSS内容
-                feed = self.fetch_rss_feed(rss_url)
-                if not feed:
-                    continue
-                
-                # 解析文章
-                for entry in feed.entries:
-                    article = self.parse_article_content(entry)
-                    if not article:
+            if not source.get('url', ''):
+                logger.warning(f"跳过无效的RSS源: {source.get('name', '未知来源')}")
+                continue
+            valid_sources.append(source)
+        
+        # 各RSS源的下载互不依赖，放到线程池中并发进行；解析仍按源的顺序在当前线程完成
+        with ThreadPoolExecutor(max_workers=min(MAX_FEED_WORKERS, len(valid_sources)) or 1) as executor:
+            futures = []
+            for source in valid_sources:
+                logger.info(f"正在检查RSS源: {source.get('name', '未知来源')}")
+                futures.append(executor.submit(self.fetch_rss_feed, source['url']))
+            
+            for source, future in zip(valid_sources, futures):
+                try:
+                    source_name = source.get('name', '未知来源')
+                    rss_url = source['url']
+                    
+                    # 获取RSS内容
+                    feed = future.result()
+                    if not feed:
                         continue
                     
-                    # 检查文章发布时间
-                    article_time = datetime.fromisoformat(article['published'])
-                    if article_time > since_time:
-                        article['source'] = source_name
-                        article['rss_url'] = rss_url
+                    # 解析文章
+                    for entry in feed.entries:
+                        # 之前处理过的文章不会再变成新文章，直接跳过，省去HTML解析
+                        guid = entry.get('id', entry.get('link', ''))
+                        if guid in self._seen_guids:
+                            continue
+                        
+                        # 先检查发布时间，过期的文章不必进行HTML解析
+                        article_time = self.get_entry_published(entry)
+                        if article_time <= since_time:
+                            if guid:
+                                self._seen_guids[guid] = None
+                            continue
                         
-                        # 下载图片
-                        for i, image in enumerate(article['images']):
-                            local_path = self.download_image(image['url'])
-                            if local_path:
-                                article['images'][i]['local_path'] = local_path
+                        article = self.parse_article_content(entry, article_time)
+                        if not article:
+                            continue
+                        if guid:
+                            self._seen_guids[guid] = None
                         
-                        all_new_articles.append(article)
+                        article['source'] = source_name
+                        article['rss_url'] = rss_url
+                        new_entries.append((article_time, article))
                         logger.info(f"发现新文章: {article['title']}")
-                
-            except Exception as e:
-                logger.error(f"处理RSS源 {source.get('name', 'unknown')} 失败: {e}")
-                continue
+                    
+                except Exception as e:
+                    logger.error(f"处理RSS源 {source.get('name', 'unknown')} 失败: {e}")
+                    continue
+        
+        self.save_feed_meta()
+        self.save_seen_guids()
+        
+        # 按发布时间从新到旧排序
+        new_entries.sort(key=itemgetter(0), reverse=True)
+        all_new_articles = [article for _, article in new_entries]
         
-        # 按发布时间排序
-        all_new_articles.sort(key=lambda x: x['published'], reverse=True)
+        # 所有源解析完成后统一下载图片。正文不含招聘关键词的文章也要下载，
+        # 只有图片中有招聘信息的文章要靠OCR识别出来
+        if OCR_AVAILABLE:
+            self.download_article_images(all_new_articles)
+        else:
+            logger.info("PaddleOCR未安装，跳过图片下载")
         
         logger.info(f"共发现 {len(all_new_articles)} 篇新文章")
         return all_new_articles
@@ -316,26 +605,103 @@ class RSSMonitor:
             articles: 文章列表
         """
         try:
-            with open(self.articles_cache_file, 'w', encoding='utf-8') as f:
-                json.dump(articles, f, ensure_ascii=False, indent=2)
+            # 正文写入单独的文件，缓存文件中用content_path引用，避免缓存体积随正文长度膨胀
+            cached_articles = []
+            for article in articles:
+                cached = dict(article)
+                full_content = cached.pop('full_content', None)
+                if full_content is not None:
+                    cached['content_path'] = self.save_article_content(cached.get('guid') or cached.get('link', ''), full_content)
+                cached_articles.append(cached)
+            
+            _atomic_write(self.articles_cache_file, orjson.dumps(cached_articles, option=orjson.OPT_INDENT_2))
             logger.info(f"已保存 {len(articles)} 篇文章到缓存")
+            
+            # 缓存每次整体重写，不再被引用的正文文件随之删除，避免正文目录无限增长
+            self.prune_article_contents({
+                os.path.basename(cached['content_path'])
+                for cached in cached_articles if cached.get('content_path')
+            })
         except Exception as e:
             logger.error(f"保存文章缓存失败: {e}")
     
+    def prune_article_contents(self, keep: Set[str]):
+        """
+        删除正文目录中不再被文章缓存引用的正文文件
+        
+        Args:
+            keep: 需要保留的正文文件名
+        """
+        try:
+            entries = list(os.scandir(self.content_dir))
+        except FileNotFoundError:
+            return
+        
+        removed = 0
+        for entry in entries:
+            if entry.name.endswith('.txt') and entry.name not in keep:
+                try:
+                    os.remove(entry.path)
+                    removed += 1
+                except OSError as e:
+                    logger.warning(f"删除正文文件失败 {entry.path}: {e}")
+        if removed:
+            logger.info(f"已清理 {removed} 个过期的正文文件")
+    
+    def save_article_content(self, guid: str, content: str) -> str:
+        """
+        保存文章正文到单独的文件
+        
+        Args:
+            guid: 文章唯一标识符
+            content: 文章正文
+            
+        Returns:
+            正文文件路径
+        """
+        os.makedirs(self.content_dir, exist_ok=True)
+        filename = hashlib.blake2b(guid.encode('utf-8'), digest_size=12).hexdigest() + '.txt'
+        path = os.path.join(self.content_dir, filename)
+        _atomic_write(path, content.encode('utf-8'))
+        return path
+    
+    def load_article_content(self, article: Dict) -> str:
+        """
+        读取缓存文章的正文
+        
+        Args:
+            article: 缓存的文章信息
+            
+        Returns:
+            文章正文，不存在时返回空字符串
+        """
+        if 'full_content' in article:
+            return article['full_content']
+        
+        content_path = article.get('content_path')
+        if not content_path or not os.path.exists(content_path):
+            return ''
+        with open(content_path, 'r', encoding='utf-8') as f:
+            return f.read()
+    
     def load_articles_cache(self) -> List[Dict]:
         """
         加载文章缓存
         
         Returns:
-            缓存的文章列表
+            缓存的文章列表，正文不随缓存加载，需要时通过load_article_content读取
         """
         try:
-            if os.path.exists(self.articles_cache_file):
-                with open(self.articles_cache_file, 'r', encoding='utf-8') as f:
-                    articles = json.load(f)
-                    logger.info(f"加载了 {len(articles)} 篇缓存文章")
-                    return articles
-            return []
+            if not os.path.exists(self.articles_cache_file) or os.path.getsize(self.articles_cache_file) == 0:
+                return []
+            
+            # 内存映射后直接交给orjson解析，不再先把整个文件读成一份bytes副本
+            with open(self.articles_cache_file, 'rb') as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    with memoryview(mm) as view:
+                        articles = orjson.loads(view)
+            logger.info(f"加载了 {len(articles)} 篇缓存文章")
+            return articles
         except Exception as e:
             logger.error(f"加载文章缓存失败: {e}")
             return []
@@ -4,28 +4,48 @@
 使用模拟数据测试完整系统功能
 """
 
+import io
 import os
 import sys
 import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from types import MappingProxyType
 
-# 设置环境变量
-os.environ['DEEPSEEK_API_KEY'] = 'sk-92d52c5e40fc48bd89bbe1fd60ebb45e'
+def _setup_env():
+    """设置测试用的环境变量和模块搜索路径，只在直接运行本脚本时调用，导入本模块不产生副作用"""
+    os.environ.setdefault('DEEPSEEK_API_KEY', 'sk-92d52c5e40fc48bd89bbe1fd60ebb45e')
+    
+    # 添加src目录到Python路径
+    src_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src')
+    if src_dir not in sys.path:
+        sys.path.insert(0, src_dir)
+
+# 模拟数据不需要各自不同的时间戳，统一使用同一个时间
+_NOW_ISO = datetime.now().isoformat()
 
-# 添加src目录到Python路径
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+# 模拟招聘信息共用的薪资币种和周期字段
+_CNY_MONTHLY = MappingProxyType({'salary_currency': 'CNY', 'salary_period': 'monthly'})
 
-from content_analyzer import ContentAnalyzer
-from job_extractor import JobExtractor
-from notification import NotificationSender
+# 模拟文章数据只构建一次，各测试取用其浅拷贝
+_MOCK_ARTICLES = None
 
 def create_mock_articles():
     """创建模拟的文章数据"""
+    global _MOCK_ARTICLES
+    if _MOCK_ARTICLES is None:
+        _MOCK_ARTICLES = tuple(MappingProxyType(article) for article in _build_mock_articles())
+    # 浅拷贝即可：测试只会在文章上新增或替换字段，正文等大字符串共享同一对象
+    return [dict(article) for article in _MOCK_ARTICLES]
+
+def _build_mock_articles():
+    """构建模拟的文章数据"""
     return [
         {
             'title': '【招聘】深焦DeepFocus诚聘副导演',
             'source': '深焦DeepFocus',
-            'published': datetime.now().isoformat(),
+            'published': _NOW_ISO,
             'link': 'https://mp.weixin.qq.com/s/test123',
             'full_content': """
 深焦DeepFocus影视制作团队现诚聘副导演一名。
@@ -59,7 +79,7 @@ def create_mock_articles():
         {
             'title': '校影学院急招摄影助理',
             'source': '校影',
-            'published': datetime.now().isoformat(),
+            'published': _NOW_ISO,
             'link': 'https://mp.weixin.qq.com/s/test456',
             'full_content': """
 校影学院摄影部门急招摄影助理2名。
@@ -88,7 +108,7 @@ def create_mock_articles():
         {
             'title': '深焦电影节观察：2024年度最佳影片盘点',
             'source': '深焦DeepFocus',
-            'published': datetime.now().isoformat(),
+            'published': _NOW_ISO,
             'link': 'https://mp.weixin.qq.com/s/test789',
             'full_content': """
 2024年即将结束，让我们回顾这一年的优秀电影作品。
@@ -111,8 +131,14 @@ def create_mock_articles():
         }
     ]
 
+def _preview(text, limit=200):
+    """截取预览文本，只有超长时才切片并加省略号"""
+    return text if len(text) <= limit else text[:limit] + '...'
+
 def test_ai_analysis():
     """测试AI内容分析功能"""
+    from content_analyzer import ContentAnalyzer
+    
     print("🤖 测试AI内容分析...")
     
     analyzer = ContentAnalyzer()
@@ -133,9 +159,12 @@ def test_ai_analysis():
         print(f"\n📄 文章: {article['title']}")
         
         ai_summary = article.get('ai_summary', {})
+        if ai_summary.get('skipped'):
+            print("⏭️ 未命中招聘关键词，未调用API")
+            continue
         if ai_summary.get('success'):
             print("✅ AI分析成功")
-            print(f"💬 总结: {ai_summary['summary'][:200]}...")
+            print(f"💬 总结: {_preview(ai_summary['summary'])}")
         else:
             print("❌ AI分析失败")
         
@@ -153,6 +182,8 @@ def test_ai_analysis():
 
 def test_job_extraction():
     """测试招聘信息提取功能"""
+    from job_extractor import JobExtractor
+    
     print("\n📊 测试招聘信息提取...")
     
     # 创建包含AI分析结果的文章
@@ -221,35 +252,35 @@ def test_job_extraction():
 
 def test_notification():
     """测试通知功能"""
+    from notification import NotificationSender
+    
     print("\n📧 测试通知功能...")
     
     # 模拟招聘信息
     test_jobs = [
         {
+            **_CNY_MONTHLY,
             'job_title': '副导演',
             'company_name': '深焦DeepFocus',
             'location': '北京市朝阳区',
             'salary_min': 12000,
             'salary_max': 18000,
-            'salary_currency': 'CNY',
-            'salary_period': 'monthly',
             'contact_phone': '13800138000',
             'contact_email': 'hr@deepfocus.com',
             'source': '深焦DeepFocus',
-            'published_date': datetime.now().isoformat()
+            'published_date': _NOW_ISO
         },
         {
+            **_CNY_MONTHLY,
             'job_title': '摄影助理',
             'company_name': '校影学院',
             'location': '上海市静安区',
             'salary_min': 8000,
             'salary_max': 12000,
-            'salary_currency': 'CNY',
-            'salary_period': 'monthly',
             'contact_phone': '13900139000',
             'contact_email': 'xiaoying@academy.edu',
             'source': '校影',
-            'published_date': datetime.now().isoformat()
+            'published_date': _NOW_ISO
         }
     ]
     
@@ -279,63 +310,95 @@ def test_notification():
     
     return True
 
-def main():
-    """主测试函数"""
-    print("🎬 微信公众号招聘信息监控系统 - 完整功能测试")
-    print("=" * 60)
+class _ThreadLocalOutput:
+    """替换sys.stdout，把各线程的输出写入各自的缓冲区"""
     
-    results = []
+    def __init__(self, stream):
+        self.stream = stream
+        self._local = threading.local()
     
-    # 测试AI分析
-    try:
-        success = test_ai_analysis()
-        results.append(("AI内容分析", success))
-    except Exception as e:
-        print(f"❌ AI分析测试异常: {e}")
-        results.append(("AI内容分析", False))
+    def write(self, text):
+        buffer = getattr(self._local, 'buffer', None)
+        return (buffer or self.stream).write(text)
     
-    # 测试信息提取
-    try:
-        success = test_job_extraction()
-        results.append(("招聘信息提取", success))
-    except Exception as e:
-        print(f"❌ 信息提取测试异常: {e}")
-        results.append(("招聘信息提取", False))
+    def flush(self):
+        buffer = getattr(self._local, 'buffer', None)
+        (buffer or self.stream).flush()
+    
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
     
-    # 测试通知
+    def capture(self, func, *args):
+        """在当前线程中运行func，返回 (func的返回值, 期间的输出)"""
+        self._local.buffer = io.StringIO()
+        try:
+            return func(*args), self._local.buffer.getvalue()
+        finally:
+            self._local.buffer = None
+
+def _run_test(test_name, test_func):
+    """运行单个测试，异常视为失败"""
     try:
-        success = test_notification()
-        results.append(("通知功能", success))
+        return test_func()
     except Exception as e:
-        print(f"❌ 通知测试异常: {e}")
-        results.append(("通知功能", False))
+        print(f"❌ {test_name}测试异常: {e}")
+        return False
+
+# 要运行的测试：(名称, 测试函数)
+TESTS = (
+    ("AI内容分析", test_ai_analysis),
+    ("招聘信息提取", test_job_extraction),
+    ("通知功能", test_notification),
+)
+
+def main():
+    """主测试函数"""
+    _setup_env()
     
-    # 汇总结果
-    print("\n" + "=" * 60)
-    print("🎯 测试结果汇总")
+    print("🎬 微信公众号招聘信息监控系统 - 完整功能测试")
     print("=" * 60)
     
-    passed = 0
+    results = []
+    
+    # 各测试互不依赖（网络请求、写报告文件、生成通知内容），并发运行；
+    # 每个测试的输出先缓存，再按顺序整体打印，避免互相穿插
+    output = _ThreadLocalOutput(sys.stdout)
+    sys.stdout = output
+    try:
+        with ThreadPoolExecutor(max_workers=len(TESTS)) as executor:
+            futures = [executor.submit(output.capture, _run_test, test_name, test_func)
+                       for test_name, test_func in TESTS]
+            for (test_name, _), future in zip(TESTS, futures):
+                success, text = future.result()
+                output.stream.write(text)
+                results.append((test_name, success))
+    finally:
+        sys.stdout = output.stream
+    
+    # 汇总结果：整段内容拼接好后一次写出
+    passed = sum(1 for _, success in results if success)
     total = len(results)
     
+    lines = ["", "=" * 60, "🎯 测试结果汇总", "=" * 60]
     for test_name, success in results:
         status = "✅ 通过" if success else "❌ 失败"
-        print(f"{test_name}: {status}")
-        if success:
-            passed += 1
+        lines.append(f"{test_name}: {status}")
     
-    print(f"\n📊 总计: {passed}/{total} 通过")
-    print(f"🎉 成功率: {passed/total*100:.1f}%")
+    lines.append(f"\n📊 总计: {passed}/{total} 通过")
+    lines.append(f"🎉 成功率: {passed/total*100:.1f}%")
     
     if passed == total:
-        print("\n🎉 所有功能测试通过！系统完全正常运行！")
-        print("✅ DeepSeek API集成成功")
-        print("✅ 招聘信息提取功能正常") 
-        print("✅ 报告生成功能正常")
-        print("✅ 通知功能正常")
-        print("\n🚀 系统已就绪，可以部署到GitHub Actions！")
+        lines.append("\n🎉 所有功能测试通过！系统完全正常运行！")
+        lines.append("✅ DeepSeek API集成成功")
+        lines.append("✅ 招聘信息提取功能正常")
+        lines.append("✅ 报告生成功能正常")
+        lines.append("✅ 通知功能正常")
+        lines.append("\n🚀 系统已就绪，可以部署到GitHub Actions！")
     else:
-        print(f"\n⚠️ 有 {total-passed} 个功能需要检查")
+        lines.append(f"\n⚠️ 有 {total-passed} 个功能需要检查")
+    
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file